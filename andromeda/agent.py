@@ -78,6 +78,25 @@ class AIAgent:
             logger.warning("Failed to pre-warm Ollama model", exc_info=True)
 
 
+    # Warm Ollama's prompt cache with the current prefix (system prompt + history + tools)
+    # Meant to run while STT transcribes, so the real request only evaluates the new user turn
+    async def prefill(self) -> None:
+        if self._client is None:
+            return
+
+        self._check_history_timeout()
+        messages = [{"role": "system", "content": self._cfg.system_prompt}, *self._conversation]
+        payload = self._build_payload(messages, stream=False)
+        payload["options"] = {"num_predict": 1}
+
+        try:
+            response = await self._client.post(_MODEL_CHAT_PATH, json=payload)
+            response.raise_for_status()
+            logger.debug("Prompt prefix prefilled (%d messages)", len(messages))
+        except Exception:
+            logger.debug("Prompt prefill failed", exc_info=True)
+
+
     def register_tool(self, tool_definition: dict, handler: Callable) -> None:
         self._tools.append(tool_definition)
         func_name = tool_definition["function"]["name"]
@@ -163,7 +182,8 @@ class AIAgent:
         try:
             response_text = await self._complete_with_tools()
             self._conversation.append({"role": "assistant", "content": response_text})
-            logger.info("Agent response: %s", " ".join(response_text[:200].split()))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Agent response: %s", " ".join(response_text[:200].split()))
             return response_text
 
         except httpx.ConnectError:
@@ -197,7 +217,8 @@ class AIAgent:
             # First, handle tool calls (non-streaming, tools need full response)
             full_text = await self._complete_with_tools_streaming(sentence_queue)
             self._conversation.append({"role": "assistant", "content": full_text})
-            logger.info("Agent response (streamed): %s", " ".join(full_text[:200].split()))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Agent response (streamed): %s", " ".join(full_text[:200].split()))
             return full_text
 
         except httpx.ConnectError:
@@ -386,8 +407,15 @@ class AIAgent:
             await AIAgent._queue_put(queue, remainder)
 
 
+    # Fast path put_nowait; only wrap in wait_for (which spawns a task) when the queue is full
     @staticmethod
     async def _queue_put(queue: asyncio.Queue, value: str) -> None:
+        try:
+            queue.put_nowait(value)
+            return
+        except asyncio.QueueFull:
+            pass
+
         try:
             await asyncio.wait_for(queue.put(value), timeout=_QUEUE_PUT_TIMEOUT_SEC)
         except asyncio.TimeoutError:
@@ -446,7 +474,7 @@ class AIAgent:
                 result = await handler(func_args)
             else:
                 result = handler(func_args)
-            logger.info("[ TOOL ] %s result: %s", func_name, str(result)[:200])
+            logger.info("[ TOOL ] %s result: %.200s", func_name, result)
             return str(result)
         except Exception as e:
             logger.exception("[ TOOL ] %s failed: %s", func_name, e)
@@ -6,7 +6,8 @@ import logging
 import threading
 import numpy as np
 import sounddevice as sd
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from enum import Enum, auto
 from andromeda.config import AudioConfig, NoiseConfig
 
@@ -19,6 +20,13 @@ _NOISE_SNR_THRESHOLD_DB = 15.0
 AudioFrameCallback = Callable[[bytes, np.ndarray], None]
 
 
+# RMS of a single int16 PCM frame
+def _frame_rms(frame_bytes: bytes) -> float:
+    audio = np.frombuffer(frame_bytes, dtype=np.int16).astype(np.float32)
+
+    return float(np.sqrt(np.mean(audio ** 2)))
+
+
 class AudioRouteMode(Enum):
     NORMAL = auto()       # frames go to all listeners (wake word + VAD) and buffers
     MUTED = auto()        # frames dropped entirely
@@ -46,6 +54,7 @@ class AudioCapture:
 
         self._lock = threading.Lock()
         self._route_mode = AudioRouteMode.NORMAL
+        self._mute_depth = 0  # Nested request_mute() holders (event loop thread only)
 
 
     # Register callback for each audio frame
@@ -80,11 +89,37 @@ class AudioCapture:
         self._route_mode = AudioRouteMode.MUTED
 
 
-    # Unmute input (normal mode)
+    # Unmute input (normal mode). Also drops any outstanding mute requests
     def unmute(self) -> None:
+        self._mute_depth = 0
         self._route_mode = AudioRouteMode.NORMAL
 
 
+    # Ref-counted mute: nested holders share one muted span, only the last release unmutes
+    def request_mute(self) -> None:
+        self._mute_depth += 1
+        self._route_mode = AudioRouteMode.MUTED
+
+
+    def release_mute(self) -> None:
+        if self._mute_depth == 0:
+            return
+
+        self._mute_depth -= 1
+        if self._mute_depth == 0:
+            self._route_mode = AudioRouteMode.NORMAL
+
+
+    # Scoped ref-counted mute: `with audio.muted(): ...` always releases, even on error
+    @contextmanager
+    def muted(self) -> Iterator[None]:
+        self.request_mute()
+        try:
+            yield
+        finally:
+            self.release_mute()
+
+
     # Monitor-only mode: dispatch frames to callbacks (wake word) but skip buffers
     def monitor_only(self) -> None:
         self._route_mode = AudioRouteMode.MONITOR_ONLY
@@ -100,14 +135,17 @@ class AudioCapture:
 
     # Stop recording and return collected audio as numpy array
     def stop_recording(self) -> np.ndarray:
+        # Swap the chunk list out under the lock; the join happens outside it
         with self._lock:
             self._is_recording = False
             if not self._recording_buffer:
                 return np.array([], dtype=np.int16)
-            audio_bytes = b"".join(self._recording_buffer)
-            self._recording_buffer.clear()
+            chunks = self._recording_buffer
+            self._recording_buffer = []
 
-        audio = (np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0)
+        # Single float32 allocation, scaled in place
+        audio = np.frombuffer(b"".join(chunks), dtype=np.int16).astype(np.float32)
+        audio *= 1.0 / 32768.0
         logger.debug("Recording stopped: %.2f sec", len(audio) / self._cfg.sample_rate)
 
         if self._noise_cfg.enabled:
@@ -130,21 +168,29 @@ class AudioCapture:
         if not frames:
             return 0.0
 
-        speech_energies = []
+        speech_frames = []
         for frame_bytes in frames:
             try:
                 if vad.is_speech(frame_bytes, sample_rate=sample_rate):
-                    audio = np.frombuffer(frame_bytes, dtype=np.int16)
-                    rms = float(np.sqrt(np.mean(audio.astype(np.float32) ** 2)))
-                    speech_energies.append(rms)
+                    speech_frames.append(frame_bytes)
             except Exception:
                 continue
 
-        if not speech_energies:
+        if not speech_frames:
             return 0.0
 
+        # Frames normally share the stream blocksize: compute every per-frame RMS in one 2D pass.
+        # Sizes are checked explicitly, since a reshape can succeed with rows straddling frames
+        frame_len = len(speech_frames[0])
+        if all(len(frame_bytes) == frame_len for frame_bytes in speech_frames):
+            audio = np.frombuffer(b"".join(speech_frames), dtype=np.int16).astype(np.float32)
+            audio = audio.reshape(len(speech_frames), -1)
+            speech_energies = np.sqrt(np.einsum("ij,ij->i", audio, audio) / audio.shape[1])
+        else:
+            speech_energies = [_frame_rms(frame_bytes) for frame_bytes in speech_frames]
+
         median_energy = float(np.median(speech_energies))
-        logger.debug("Calibration: %d speech frames, median RMS=%.1f", len(speech_energies), median_energy)
+        logger.debug("Calibration: %d speech frames, median RMS=%.1f", len(speech_frames), median_energy)
 
         return median_energy
 
@@ -6,6 +6,9 @@ from pathlib import Path
 from typing import Self
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it (much faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass(frozen=True)
 class AudioConfig:
@@ -104,6 +107,8 @@ class AgentConfig:
     streaming: bool = True
     streaming_clause_split: bool = True
     prewarm: bool = True
+    prefill: bool = True
+    prefix_refresh_sec: float = 240.0
     system_prompt: str = (
         "Sei un assistente vocale domestico intelligente. Ti chiami Andromeda. "
         "Rispondi in italiano, in modo conciso e naturale. "
@@ -119,6 +124,8 @@ class AgentConfig:
             raise ValueError(f"max_tokens must be >= 1, got {self.max_tokens}")
         if self.timeout_sec <= 0:
             raise ValueError(f"timeout_sec must be > 0, got {self.timeout_sec}")
+        if self.prefix_refresh_sec < 0:
+            raise ValueError(f"prefix_refresh_sec must be >= 0, got {self.prefix_refresh_sec}")
 
 
 @dataclass(frozen=True)
@@ -216,7 +223,7 @@ class AppConfig:
             return cls()
 
         with config_path.open() as f:
-            raw = yaml.safe_load(f) or {}
+            raw = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         return cls(
             audio=AudioConfig(**raw.get("audio", {})),
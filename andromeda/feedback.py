@@ -2,6 +2,7 @@
 # Licensed under MIT
 
 import logging
+import queue
 import threading
 import numpy as np
 import sounddevice as sd
@@ -26,6 +27,13 @@ class AudioFeedback:
         self._thinking_stop = threading.Event()
         self._thinking_thread: threading.Thread | None = None
 
+        # Short cues are handed to a worker thread: opening the output stream inside
+        # sd.play() can take tens of ms and must not stall the event loop. Blocking cues go
+        # through the same queue (with a completion event) so cues never overlap
+        self._cues: queue.Queue[tuple[np.ndarray, threading.Event | None]] = queue.Queue()
+        self._cue_thread: threading.Thread | None = None
+        self._cue_thread_lock = threading.Lock()
+
 
     # Load or generate feedback sounds
     def initialize(self) -> None:
@@ -43,11 +51,33 @@ class AudioFeedback:
             return
 
         audio = self._sounds.get(sound_name)
-        if audio is not None:
+        if audio is None:
+            return
+
+        self._ensure_cue_thread()
+        self._cues.put((audio, None))
+
+
+    # Start the cue worker on first use (locked: concurrent callers must not start two)
+    def _ensure_cue_thread(self) -> None:
+        with self._cue_thread_lock:
+            if self._cue_thread is None:
+                self._cue_thread = threading.Thread(target=self._run_cues, name="andromeda-feedback", daemon=True)
+                self._cue_thread.start()
+
+
+    # Background thread: play queued cues in order, signalling blocking callers when theirs is done
+    def _run_cues(self) -> None:
+        while True:
+            audio, done = self._cues.get()
             try:
-                sd.play(audio, samplerate=self._audio_cfg.sample_rate)
+                sd.play(audio, samplerate=self._audio_cfg.sample_rate, blocking=done is not None)
             except Exception:
-                logger.warning("Failed to play feedback: %s", sound_name)
+                logger.warning("Failed to play feedback cue")
+            finally:
+                if done is not None:
+                    done.set()
+                self._cues.task_done()
 
 
     # Signal the thinking tone to fade out smoothly (non-blocking)
@@ -56,14 +86,16 @@ class AudioFeedback:
         self._thinking_stop.set()
 
 
-    # Play a named feedback sound (blocking)
+    # Play a named feedback sound (blocking): queued behind pending cues, returns once it has played
     def play_blocking(self, sound_name: str) -> None:
         audio = self._sounds.get(sound_name)
-        if audio is not None:
-            try:
-                sd.play(audio, samplerate=self._audio_cfg.sample_rate, blocking=True)
-            except Exception:
-                logger.warning("Failed to play feedback: %s", sound_name)
+        if audio is None:
+            return
+
+        done = threading.Event()
+        self._ensure_cue_thread()
+        self._cues.put((audio, done))
+        done.wait()
 
 
     # Start thinking tone on a dedicated OutputStream (allows smooth fade-out)
@@ -5,7 +5,7 @@ import inspect
 import logging
 import re
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from andromeda.messages import msg
 
 logger = logging.getLogger("[ INTENT ]")
@@ -15,24 +15,74 @@ logger = logging.getLogger("[ INTENT ]")
 # Each intent has keyword patterns and a tool handler to call directly.
 # Returns None if no intent matched (falls through to LLM).
 _intents: list[dict] = []
+_combined: re.Pattern | None = None  # All intents fused into one regex, rebuilt on registration
 _lock = threading.Lock()
 
 
-def register_intent(patterns: list[str], tool_handler: Callable, args: dict | None = None) -> None:
-    compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
+# Patterns may be raw strings or already compiled (e.g. module-level constants compiled once at import)
+def register_intent(patterns: Iterable[str | re.Pattern], tool_handler: Callable, args: dict | None = None) -> None:
+    compiled = [p if isinstance(p, re.Pattern) else re.compile(p, re.IGNORECASE) for p in patterns]
     with _lock:
         _intents.append({"patterns": compiled, "handler": tool_handler, "args": args or {}})
+        _rebuild_combined()
 
 
 def clear_intents() -> None:
     with _lock:
         _intents.clear()
+        _rebuild_combined()
+
+
+# Inline flags that can be scoped to a group, so each pattern keeps its own flags inside the fused regex
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+# Wrap a compiled pattern as a group carrying its own flags. None if its flags cannot be scoped
+def _scoped_branch(pattern: re.Pattern) -> str | None:
+    if not isinstance(pattern.pattern, str) or pattern.flags & (re.ASCII | re.LOCALE):
+        return None
+
+    letters = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    # In verbose mode a trailing "# comment" would swallow the closing parenthesis
+    body = f"{pattern.pattern}\n" if pattern.flags & re.VERBOSE else pattern.pattern
+
+    return f"(?{letters}:{body})" if letters else f"(?:{body})"
+
+
+# Fuse every intent into a single regex so matching is one engine call instead of a Python loop.
+# Each intent is an anchored lookahead tried in registration order, so the first registered
+# intent still wins regardless of where its phrase appears in the text. Group "i<N>" is the match.
+# Falls back to the per-pattern loop if the patterns cannot be combined (e.g. duplicate group names)
+def _rebuild_combined() -> None:
+    global _combined
+    if not _intents:
+        _combined = None
+        return
+
+    branches = []
+    for index, intent in enumerate(_intents):
+        scoped = [_scoped_branch(p) for p in intent["patterns"]]
+        if None in scoped:
+            logger.warning("Cannot combine intent patterns, using per-pattern matching")
+            _combined = None
+            return
+        branches.append(f"(?=[\\s\\S]*?(?P<i{index}>{'|'.join(scoped)}))")
+
+    try:
+        _combined = re.compile(rf"\A(?:{'|'.join(branches)})")
+    except re.error:
+        logger.warning("Cannot combine intent patterns, using per-pattern matching")
+        _combined = None
 
 
 async def match_and_execute(text: str) -> str | None:
     text_lower = text.lower().strip()
     with _lock:
         intents = list(_intents)
+        combined = _combined
+
+    if combined is not None:
+        return await _match_combined(combined, intents, text_lower)
 
     for intent in intents:
         for pattern in intent["patterns"]:
@@ -49,6 +99,17 @@ async def match_and_execute(text: str) -> str | None:
     return None
 
 
+async def _match_combined(combined: re.Pattern, intents: list[dict], text: str) -> str | None:
+    match = combined.match(text)
+    if match is None:
+        return None
+
+    intent = intents[int(match.lastgroup[1:])]
+    logger.info("Fast intent matched: %s", match.group(match.lastgroup))
+
+    return await _run_handler(intent["handler"], intent["args"])
+
+
 async def _run_handler(handler: Callable, args: dict) -> str:
     try:
         if inspect.iscoroutinefunction(handler):
@@ -7,8 +7,12 @@ warnings.filterwarnings("ignore", message="pkg_resources is deprecated")
 import asyncio
 import contextlib
 import logging
+import os
 import signal
 import sys
+import numpy as np
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 import webrtcvad
 from pathlib import Path
 from andromeda.agent import AIAgent
@@ -30,12 +34,55 @@ from andromeda.wake_word import WakeWordDetector
 logger = logging.getLogger("[ MAIN ]")
 
 
+# Startup banner, emitted as a single log record only when INFO logging is enabled
+# Leading newline keeps the art aligned below the log prefix
+_BANNER_LINES = (
+    ".-------------------------------------------------------------.",
+    "|                     _                              _        |",
+    "|     /\\             | |                            | |       |",
+    "|    /  \\   _ __   __| |_ __ ___  _ __ ___   ___  __| | __ _  |",
+    "|   / /\\ \\ | '_ \\ / _` | '__/ _ \\| '_ ` _ \\ / _ \\/ _` |/ _` | |",
+    "|  / ____ \\| | | | (_| | | | (_) | | | | | |  __/ (_| | (_| | |",
+    "| /_/    \\_\\_| |_|\\__,_|_|  \\___/|_| |_| |_|\\___|\\__,_|\\__,_| |",
+    "|                                                             |",
+    "|          Smart home assistant completely offline            |",
+    "|            alessandro.orru <at> aleostudio.com              |",
+    "'-------------------------------------------------------------'",
+    "",
+)
+_BANNER = "\n" + "\n".join(_BANNER_LINES)
+
+
+# Ask the kernel to start reading a model file into page cache ahead of initialize()
+# Best-effort: posix_fadvise is Linux-only and missing files are simply skipped
+def _prefetch_file(path: str) -> None:
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        logger.debug("posix_fadvise failed for %s", path)
+    finally:
+        os.close(fd)
+
+
 # Main application class that wires all components together
 class VoiceAssistant:
 
     def __init__(self, config: AppConfig) -> None:
         self._cfg = config
 
+        # Start model readahead so disk I/O overlaps with the rest of startup
+        _prefetch_file(config.wake_word.model_path)
+        if config.tts.engine == "piper":
+            _prefetch_file(config.tts.piper_model_path)
+
         # Components
         self._audio = AudioCapture(config.audio, config.noise)
         self._wake_word = WakeWordDetector(config.audio, config.wake_word)
@@ -62,23 +109,21 @@ class VoiceAssistant:
         self._is_follow_up: bool = False  # True when listening for follow-up (no wake word needed)
         self._tts_interrupted: bool = False  # True when TTS was interrupted by wake word
         self._calibration_vad = webrtcvad.Vad(config.vad.aggressiveness)  # Reuse for calibration
+        self._prefill_task: asyncio.Task | None = None  # LLM prompt prefill overlapping STT
+        self._keepalive_task: asyncio.Task | None = None  # Periodic prompt cache refresh while IDLE
+        self._models_task: asyncio.Task | None = None  # Background STT/TTS load started by run()
+        self._loop: asyncio.AbstractEventLoop | None = None  # Captured once in run()
 
+        # Dedicated threads for long blocking waits (end of speech),
+        # so they never tie up workers of the default executor
+        self._wait_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="andromeda-wait")
 
-    # Initialize all components. Call before run()
+
+    # Initialize lightweight components. Call before run()
+    # Heavy STT/TTS models are loaded in background by run(), so the wake word is live sooner
     def initialize(self) -> None:
         set_locale(self._cfg.stt.language)
-        logger.info(".-------------------------------------------------------------.")
-        logger.info("|                     _                              _        |")
-        logger.info("|     /\\             | |                            | |       |")
-        logger.info("|    /  \\   _ __   __| |_ __ ___  _ __ ___   ___  __| | __ _  |")
-        logger.info("|   / /\\ \\ | '_ \\ / _` | '__/ _ \\| '_ ` _ \\ / _ \\/ _` |/ _` | |")
-        logger.info("|  / ____ \\| | | | (_| | | | (_) | | | | | |  __/ (_| | (_| | |")
-        logger.info("| /_/    \\_\\_| |_|\\__,_|_|  \\___/|_| |_| |_|\\___|\\__,_|\\__,_| |")
-        logger.info("|                                                             |")
-        logger.info("|          Smart home assistant completely offline            |")
-        logger.info("|            alessandro.orru <at> aleostudio.com              |")
-        logger.info("'-------------------------------------------------------------'")
-        logger.info("")
+        logger.info(_BANNER)
         logger.info("Initializing home assistant...")
 
         # Raise every blocker exception
@@ -94,15 +139,36 @@ class VoiceAssistant:
             raise
 
         try:
-            self._stt.initialize()
+            self._agent.initialize()
         except Exception:
-            logger.exception("Failed to initialize STT engine")
+            logger.exception("Failed to initialize AI agent")
             raise
 
+        # Register tools
         try:
-            self._agent.initialize()
+            register_all_tools(self._agent, self._cfg.tools, self._feedback)
         except Exception:
-            logger.exception("Failed to initialize AI agent")
+            logger.exception("Failed to register tools")
+
+        # Wire a single fused audio callback for wake word + VAD
+        self._audio.on_audio_frame(self._process_audio_frame)
+
+        # Fade out thinking tone when TTS starts playing
+        self._tts.set_on_first_audio(self._feedback.stop)
+
+        # Wire health check providers
+        self._health.set_state_provider(lambda: self._sm.state)
+        self._health.set_metrics_provider(self._metrics.get_summary)
+
+        logger.info("Core components initialized")
+
+
+    # Load STT and TTS models (runs in a worker thread while the wake word is already live)
+    def _initialize_models(self) -> None:
+        try:
+            self._stt.initialize()
+        except Exception:
+            logger.exception("Failed to initialize STT engine")
             raise
 
         try:
@@ -117,28 +183,70 @@ class VoiceAssistant:
             except Exception:
                 logger.warning("Failed to pre-warm TTS cache")
 
-        # Register tools
-        try:
-            register_all_tools(self._agent, self._cfg.tools, self._feedback)
-        except Exception:
-            logger.exception("Failed to register tools")
+        # Warm STT hot paths before the first real utterance
+        self._stt.warmup()
+        logger.info("Speech models ready")
 
-        # Wire audio callbacks
-        self._audio.on_audio_frame(self._wake_word.process_frame)
-        self._audio.on_audio_frame(self._vad.process_frame)
 
-        # Fade out thinking tone when TTS starts playing
-        self._tts.set_on_first_audio(self._feedback.stop)
+    # Stop the assistant if background model loading failed
+    @staticmethod
+    def _on_models_loaded(task: asyncio.Task, run_task: asyncio.Task | None) -> None:
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error("Speech model loading failed, stopping")
+        if run_task is not None:
+            run_task.cancel()
 
-        # Wire health check providers
-        self._health.set_state_provider(lambda: self._sm.state)
-        self._health.set_metrics_provider(self._metrics.get_summary)
 
-        logger.info("All components initialized")
+    # Block until background model loading is done. Re-raises a load failure
+    async def _wait_models_ready(self) -> None:
+        if self._models_task is None:
+            return
+        if not self._models_task.done():
+            logger.info("Waiting for speech models to finish loading...")
+        await self._models_task
+
+
+    # Fused per-frame callback (audio thread): each frame feeds exactly one detector
+    # While VAD is monitoring (LISTENING) wake word inference is skipped: the model is
+    # reset before every use anyway, so those frames would only burn CPU
+    def _process_audio_frame(self, frame_bytes: bytes, frame_array: np.ndarray) -> None:
+        if self._vad.is_active:
+            self._vad.process_frame(frame_bytes, frame_array)
+        else:
+            self._wake_word.process_frame(frame_bytes, frame_array)
 
 
     # Run the assistant main loop
     async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+
+        # A failed model load is fatal, exactly as it was when loading happened in initialize():
+        # the load task cancels run, which then re-raises the load error so the process exits non-zero
+        run_task = asyncio.current_task()
+        self._models_task = asyncio.create_task(asyncio.to_thread(self._initialize_models))
+        self._models_task.add_done_callback(lambda task: self._on_models_loaded(task, run_task))
+
+        try:
+            await self._run_pipeline()
+        except asyncio.CancelledError:
+            models_error = self._models_load_error()
+            if models_error is not None:
+                raise models_error from None
+            raise
+
+
+    # Exception raised by background model loading, if it has finished with one
+    def _models_load_error(self) -> BaseException | None:
+        task = self._models_task
+        if task is None or not task.done() or task.cancelled():
+            return None
+
+        return task.exception()
+
+
+    # Start services and drive the state machine until cancelled
+    async def _run_pipeline(self) -> None:
         try:
             await self._health.start()
         except Exception:
@@ -147,6 +255,11 @@ class VoiceAssistant:
         # Pre-warm Ollama model (load into GPU/RAM)
         if self._cfg.agent.prewarm:
             await self._agent.prewarm_model()
+            if self._cfg.agent.prefill:
+                await self._agent.prefill()
+
+        if self._cfg.agent.prefill and self._cfg.agent.prefix_refresh_sec > 0:
+            self._keepalive_task = asyncio.create_task(self._prefix_keepalive_loop())
 
         try:
             self._audio.start()
@@ -163,6 +276,8 @@ class VoiceAssistant:
         try:
             await self._sm.run()
         finally:
+            if self._keepalive_task is not None:
+                self._keepalive_task.cancel()
             try:
                 self._wake_word.shutdown()
             except Exception:
@@ -181,15 +296,22 @@ class VoiceAssistant:
                 logger.warning("Error logging metrics summary")
 
 
+    # Keep the system prompt hot in Ollama's prompt cache (and the model loaded) while IDLE
+    async def _prefix_keepalive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._cfg.agent.prefix_refresh_sec)
+            if self._sm.state == AssistantState.IDLE:
+                await self._agent.prefill()
+
+
     # IDLE: Listen for wake word in background
     async def _handle_idle(self, _state: AssistantState) -> AssistantState:
         self._wake_word.reset()
         self._audio.unmute()
         self._is_follow_up = False
 
-        # Wait for wake word detection (runs in thread via event)
-        loop = asyncio.get_running_loop()
-        detected = await loop.run_in_executor(None, lambda: self._wake_word.wait_for_detection(timeout=None))
+        # Wait for wake word detection (woken directly from the audio thread)
+        detected = await self._wake_word.wait_for_detection_async()
 
         if detected:
             self._metrics.start_pipeline()
@@ -215,8 +337,7 @@ class VoiceAssistant:
         self._vad.start()
 
         # Wait for speech to end
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, lambda: self._vad.wait_for_speech_end(timeout=self._cfg.vad.max_recording_sec + 1))
+        await self._loop.run_in_executor(self._wait_executor, self._vad.wait_for_speech_end, self._cfg.vad.max_recording_sec + 1)
 
         self._vad.stop()
         self._recorded_audio = self._audio.stop_recording()
@@ -251,8 +372,7 @@ class VoiceAssistant:
         self._vad.start()
 
         # Wait for speech end OR follow-up timeout (whichever comes first)
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, lambda: self._vad.wait_for_speech_end(timeout=follow_up_timeout))
+        await self._loop.run_in_executor(self._wait_executor, self._vad.wait_for_speech_end, follow_up_timeout)
 
         self._vad.stop()
         self._recorded_audio = self._audio.stop_recording()
@@ -274,7 +394,18 @@ class VoiceAssistant:
 
 
     # PROCESSING: STT transcription + AI response + TTS
+    # The mic stays muted for the whole turn; nested mutes (_speak_error) share the same span
     async def _handle_processing(self, _state: AssistantState) -> AssistantState:
+        with self._audio.muted():
+            await self._wait_models_ready()
+            return await self._process_turn()
+
+
+    async def _process_turn(self) -> AssistantState:
+        # Warm the LLM prompt cache while Whisper transcribes (harmless if a fast intent matches)
+        if self._cfg.agent.prefill and (self._prefill_task is None or self._prefill_task.done()):
+            self._prefill_task = asyncio.create_task(self._agent.prefill())
+
         # Transcribe
         with self._metrics.measure("stt"):
             text = await self._stt.transcribe(self._recorded_audio)
@@ -292,14 +423,10 @@ class VoiceAssistant:
             fast_response = await match_and_execute(text)
 
         if fast_response:
-            logger.info("Fast intent response: %s", fast_response[:80])
+            logger.info("Fast intent response: %.80s", fast_response)
             self._response_text = fast_response
-            self._audio.mute()
-            try:
-                with self._metrics.measure("tts"):
-                    await self._tts.speak(fast_response)
-            finally:
-                self._audio.unmute()
+            with self._metrics.measure("tts"):
+                await self._tts.speak(fast_response)
             self._metrics.end_pipeline()
 
             return AssistantState.SPEAKING
@@ -320,7 +447,6 @@ class VoiceAssistant:
             self._response_text = msg("core.generic_error_retry")
         finally:
             self._feedback.stop()
-            self._audio.unmute()
 
         self._metrics.end_pipeline()
 
@@ -333,7 +459,6 @@ class VoiceAssistant:
 
     # Standard mode: wait for full response, then speak
     async def _process_standard(self, text: str) -> None:
-        self._audio.mute()
         self._response_text = await self._agent.process(text)
 
         # Enable wake word detection during TTS for voice interruption
@@ -379,14 +504,11 @@ class VoiceAssistant:
 
     # Monitor wake word during TTS playback to allow voice interruption
     async def _monitor_interrupt(self, tasks_to_cancel: list[asyncio.Task] | None = None) -> None:
-        loop = asyncio.get_running_loop()
         logger.debug("Interrupt monitoring active")
         poll_count = 0
 
         while True:
-            detected = await loop.run_in_executor(
-                None, lambda: self._wake_word.wait_for_detection(timeout=0.5),
-            )
+            detected = await self._wake_word.wait_for_detection_async(0.5)
             if detected:
                 logger.info("Interrupt: wake word detected during speech")
                 self._tts.stop_playback()
@@ -430,23 +552,17 @@ class VoiceAssistant:
     # Speak a short error message to the user
     async def _speak_error(self, message: str) -> None:
         logger.warning("Spoken error: %s", message)
-        try:
-            self._audio.mute()
-        except Exception:
-            logger.warning("Failed to mute audio for error message")
-        try:
-            await self._tts.speak(message)
-        except Exception:
-            logger.exception("TTS failed to speak error: %s", message)
-        finally:
+        with self._audio.muted():
             try:
-                self._audio.unmute()
+                await self._wait_models_ready()
+                await self._tts.speak(message)
             except Exception:
-                logger.warning("Failed to unmute audio after error")
+                logger.exception("TTS failed to speak error: %s", message)
 
 
     # Release all resources. Unblocks threads waiting on events
     async def shutdown(self) -> None:
+        await _cancel_tasks([self._prefill_task, self._keepalive_task, self._models_task])
         try:
             self._wake_word.shutdown()
         except Exception:
@@ -463,6 +579,20 @@ class VoiceAssistant:
             await close_client()
         except Exception:
             logger.warning("Error closing shared HTTP client")
+        self._wait_executor.shutdown(wait=False, cancel_futures=True)
+        try:
+            self._stt.shutdown()
+        except Exception:
+            logger.warning("Error shutting down STT engine")
+
+
+# Cancel all given tasks at once, then join them in a single gather
+async def _cancel_tasks(tasks: Iterable[asyncio.Task | None]) -> None:
+    pending = [t for t in tasks if t is not None and not t.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
 
 
 # Logging setup
@@ -475,6 +605,17 @@ def setup_logging(config: AppConfig) -> None:
 
 
 # Entrypoint
+# Create the main event loop, preferring uvloop's faster scheduler when it is installed
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+
+    logger.debug("Using uvloop event loop")
+    return uvloop.new_event_loop()
+
+
 def main() -> None:
     config_path = Path("config.yaml")
     if len(sys.argv) > 1:
@@ -487,7 +628,7 @@ def main() -> None:
     assistant.initialize()
 
     # Graceful shutdown
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop()
 
     def shutdown_handler() -> None:
         try:
@@ -508,6 +649,7 @@ def main() -> None:
             loop.run_until_complete(assistant.run())
     finally:
         loop.run_until_complete(assistant.shutdown())
+        loop.run_until_complete(_cancel_tasks(asyncio.all_tasks(loop)))
         loop.close()
         logger.info("Voice assistant stopped")
 
@@ -52,6 +52,7 @@ _MESSAGES = {
         "kb.delete_missing_key": "Errore: specifica quale informazione vuoi eliminare.",
         "kb.delete_not_found": "'{key}' non è presente in memoria.",
         "kb.deleted": "Ho eliminato '{key}' dalla memoria.",
+        "kb.store_unreadable": "Non riesco a leggere la memoria: il file {path} non è valido. Correggilo prima di usarla di nuovo.",
 
         "weather.missing_city": "Errore: nessuna città specificata.",
         "weather.city_not_found": "Non ho trovato la città '{city}'.",
@@ -132,6 +133,7 @@ _MESSAGES = {
         "kb.delete_missing_key": "Error: specify which information you want to delete.",
         "kb.delete_not_found": "'{key}' is not present in memory.",
         "kb.deleted": "I removed '{key}' from memory.",
+        "kb.store_unreadable": "I cannot read the memory: the file {path} is not valid. Fix it before using it again.",
 
         "weather.missing_city": "Error: no city specified.",
         "weather.city_not_found": "I could not find the city '{city}'.",
@@ -167,13 +169,13 @@ _MESSAGES = {
 }
 
 _DAYS = {
-    "it": ["lunedì", "martedì", "mercoledì", "giovedì", "venerdì", "sabato", "domenica"],
-    "en": ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"],
+    "it": ("lunedì", "martedì", "mercoledì", "giovedì", "venerdì", "sabato", "domenica"),
+    "en": ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"),
 }
 
 _MONTHS = {
-    "it": ["", "gennaio", "febbraio", "marzo", "aprile", "maggio", "giugno", "luglio", "agosto", "settembre", "ottobre", "novembre", "dicembre"],
-    "en": ["", "january", "february", "march", "april", "may", "june", "july", "august", "september", "october", "november", "december"],
+    "it": ("", "gennaio", "febbraio", "marzo", "aprile", "maggio", "giugno", "luglio", "agosto", "settembre", "ottobre", "novembre", "dicembre"),
+    "en": ("", "january", "february", "march", "april", "may", "june", "july", "august", "september", "october", "november", "december"),
 }
 
 _WEATHER_CODES = {
@@ -228,6 +230,18 @@ _WEATHER_CODES = {
 _locale = "it"
 
 
+# Resolved tables for the active locale (messages with Italian fallbacks merged in,
+# day/month names, weather codes), so lookups are a single index. Rebuilt by set_locale()
+def _build_active_table(locale: str) -> dict[str, str]:
+    return {**_MESSAGES["it"], **_MESSAGES.get(locale, {})}
+
+
+_active = _build_active_table(_locale)
+_active_days = _DAYS[_locale]
+_active_months = _MONTHS[_locale]
+_active_weather = _WEATHER_CODES[_locale]
+
+
 def _normalize_locale(locale: str | None) -> str:
     if not locale:
         return "it"
@@ -239,8 +253,12 @@ def _normalize_locale(locale: str | None) -> str:
 
 
 def set_locale(locale: str | None) -> None:
-    global _locale
+    global _locale, _active, _active_days, _active_months, _active_weather
     _locale = _normalize_locale(locale)
+    _active = _build_active_table(_locale)
+    _active_days = _DAYS[_locale]
+    _active_months = _MONTHS[_locale]
+    _active_weather = _WEATHER_CODES[_locale]
 
 
 def get_locale() -> str:
@@ -248,9 +266,7 @@ def get_locale() -> str:
 
 
 def msg(message_key: str, **kwargs) -> str:
-    template = _MESSAGES.get(_locale, _MESSAGES["it"]).get(message_key)
-    if template is None:
-        template = _MESSAGES["it"].get(message_key, message_key)
+    template = _active.get(message_key, message_key)
     if kwargs:
         return template.format(**kwargs)
 
@@ -258,15 +274,16 @@ def msg(message_key: str, **kwargs) -> str:
 
 
 def get_localized_datetime(now: datetime) -> tuple[str, str]:
-    locale = get_locale()
-    day_name = _DAYS[locale][now.weekday()]
-    month_name = _MONTHS[locale][now.month]
+    day_name = _active_days[now.weekday()]
+    month_name = _active_months[now.month]
     date_text = f"{day_name} {now.day} {month_name} {now.year}"
 
-    return date_text, now.strftime("%H:%M")
+    return date_text, f"{now.hour:02d}:{now.minute:02d}"
 
 
 def weather_condition(code: int) -> str:
-    locale = get_locale()
+    condition = _active_weather.get(code)
+    if condition is None:
+        return _active.get("weather.unknown_condition", "weather.unknown_condition")
 
-    return _WEATHER_CODES[locale].get(code, msg("weather.unknown_condition"))
+    return condition
@@ -3,14 +3,13 @@
 
 import logging
 import time
-from contextlib import contextmanager
 from dataclasses import dataclass
 
 logger = logging.getLogger("[ METRICS ]")
 
 
 # Stores latency stats for a single phase
-@dataclass
+@dataclass(slots=True)
 class PhaseMetric:
     name: str
     total_ms: float = 0.0
@@ -36,41 +35,47 @@ class PerformanceMetrics:
 
     def __init__(self) -> None:
         self._phases: dict[str, PhaseMetric] = {}
-        self._pipeline_start: float = 0.0
+        self._pipeline_start: int = 0  # perf_counter_ns() at pipeline start, 0 when idle
+        self._summary_cache: dict[str, dict] | None = None
 
 
     # Context manager to measure a phase duration
-    @contextmanager
-    def measure(self, phase_name: str):
-        start = time.monotonic()
-        try:
-            yield
-        finally:
-            duration_ms = (time.monotonic() - start) * 1000
-            if phase_name not in self._phases:
-                self._phases[phase_name] = PhaseMetric(name=phase_name)
-            self._phases[phase_name].record(duration_ms)
-            logger.debug("[PERF] %s: %.0fms", phase_name, duration_ms)
+    def measure(self, phase_name: str) -> "_PhaseTimer":
+        return _PhaseTimer(self, phase_name)
+
+
+    # Record a single duration sample for a phase
+    def record(self, phase_name: str, duration_ms: float) -> None:
+        metric = self._phases.get(phase_name)
+        if metric is None:
+            metric = self._phases[phase_name] = PhaseMetric(name=phase_name)
+        metric.record(duration_ms)
+        self._summary_cache = None
 
 
     # Mark the start of a full wake-to-response pipeline
     def start_pipeline(self) -> None:
-        self._pipeline_start = time.monotonic()
+        self._pipeline_start = time.perf_counter_ns()
 
 
     # Mark the end of a full pipeline and log total latency
     def end_pipeline(self) -> None:
         if self._pipeline_start > 0:
-            total_ms = (time.monotonic() - self._pipeline_start) * 1000
+            total_ms = (time.perf_counter_ns() - self._pipeline_start) / 1e6
             logger.debug("[PERF] pipeline_total: %.0fms", total_ms)
-            if "pipeline_total" not in self._phases:
-                self._phases["pipeline_total"] = PhaseMetric(name="pipeline_total")
-            self._phases["pipeline_total"].record(total_ms)
-            self._pipeline_start = 0.0
+            self.record("pipeline_total", total_ms)
+            self._pipeline_start = 0
 
 
     # Return summary stats for all phases
+    # Cached until the next record(), so frequent health check polls don't re-aggregate
     def get_summary(self) -> dict[str, dict]:
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+        return self._summary_cache
+
+
+    def _build_summary(self) -> dict[str, dict]:
         return {
             name: {
                 "avg_ms": round(m.avg_ms, 1),
@@ -84,7 +89,7 @@ class PerformanceMetrics:
 
     # Log a formatted summary of all phase metrics
     def log_summary(self) -> None:
-        if not self._phases:
+        if not self._phases or not logger.isEnabledFor(logging.DEBUG):
             return
         logger.debug("[PERF] Performance Summary")
         for name, m in sorted(self._phases.items()):
@@ -94,4 +99,27 @@ class PerformanceMetrics:
     # Clear all collected metrics
     def reset(self) -> None:
         self._phases.clear()
-        self._pipeline_start = 0.0
+        self._pipeline_start = 0
+        self._summary_cache = None
+
+
+# Timer returned by PerformanceMetrics.measure: a plain __slots__ object instead of a
+# generator-based @contextmanager, so entering/exiting a phase costs no extra frames
+class _PhaseTimer:
+    __slots__ = ("_metrics", "_phase_name", "_start")
+
+    def __init__(self, metrics: PerformanceMetrics, phase_name: str) -> None:
+        self._metrics = metrics
+        self._phase_name = phase_name
+        self._start = 0
+
+
+    # Integer nanosecond clock: no float math until the single ms conversion on exit
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+
+    def __exit__(self, *_exc_info) -> None:
+        duration_ms = (time.perf_counter_ns() - self._start) / 1e6
+        self._metrics.record(self._phase_name, duration_ms)
+        logger.debug("[PERF] %s: %.0fms", self._phase_name, duration_ms)
@@ -4,7 +4,7 @@
 import asyncio
 import logging
 from collections.abc import Callable, Coroutine
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Any, TypeAlias
 
 logger = logging.getLogger("[ STATE ]")
@@ -12,7 +12,8 @@ logger = logging.getLogger("[ STATE ]")
 StateHandler: TypeAlias = Callable[["AssistantState"], Coroutine[Any, Any, "AssistantState"]]
 
 
-class AssistantState(Enum):
+# IntEnum: members hash and compare at C level, so per-transition dict/set lookups stay cheap
+class AssistantState(IntEnum):
     IDLE = auto()          # Listening for wake word only
     LISTENING = auto()     # Recording user speech
     PROCESSING = auto()    # STT + Agent inference
@@ -23,14 +24,19 @@ class AssistantState(Enum):
         return self.name
 
 
+    def __format__(self, format_spec: str) -> str:
+        return format(self.name, format_spec)
+
+
 # Valid state transitions
-TRANSITIONS: dict[AssistantState, set[AssistantState]] = {
-    AssistantState.IDLE: {AssistantState.LISTENING},
-    AssistantState.LISTENING: {AssistantState.PROCESSING, AssistantState.SPEAKING, AssistantState.IDLE, AssistantState.ERROR},
-    AssistantState.PROCESSING: {AssistantState.SPEAKING, AssistantState.IDLE, AssistantState.ERROR},
-    AssistantState.SPEAKING: {AssistantState.IDLE, AssistantState.LISTENING, AssistantState.ERROR},
-    AssistantState.ERROR: {AssistantState.IDLE},
+TRANSITIONS: dict[AssistantState, frozenset[AssistantState]] = {
+    AssistantState.IDLE: frozenset({AssistantState.LISTENING}),
+    AssistantState.LISTENING: frozenset({AssistantState.PROCESSING, AssistantState.SPEAKING, AssistantState.IDLE, AssistantState.ERROR}),
+    AssistantState.PROCESSING: frozenset({AssistantState.SPEAKING, AssistantState.IDLE, AssistantState.ERROR}),
+    AssistantState.SPEAKING: frozenset({AssistantState.IDLE, AssistantState.LISTENING, AssistantState.ERROR}),
+    AssistantState.ERROR: frozenset({AssistantState.IDLE}),
 }
+_NO_TRANSITIONS: frozenset[AssistantState] = frozenset()
 
 
 # Manages assistant state transitions with validation and event dispatching
@@ -40,7 +46,6 @@ class StateMachine:
         self._state = AssistantState.IDLE
         self._handlers: dict[AssistantState, StateHandler] = {}
         self._on_transition: list[Callable[[AssistantState, AssistantState], None]] = []
-        self._lock = asyncio.Lock()
 
 
     @property
@@ -59,21 +64,23 @@ class StateMachine:
 
 
     # Validate and perform state transition
+    # No lock needed: there is no await between the check and the update, so the
+    # transition is atomic with respect to every other task on the event loop
     async def transition_to(self, new_state: AssistantState) -> None:
-        async with self._lock:
-            if new_state not in TRANSITIONS.get(self._state, set()):
-                logger.warning("Invalid transition: %s -> %s (allowed: %s)", self._state, new_state, TRANSITIONS.get(self._state, set()))
-                return
-
-            old_state = self._state
-            self._state = new_state
-            logger.info("State: %s -> %s", old_state, new_state)
-
-            for cb in self._on_transition:
-                try:
-                    cb(old_state, new_state)
-                except Exception:
-                    logger.exception("Transition callback error")
+        old_state = self._state
+        allowed = TRANSITIONS.get(old_state, _NO_TRANSITIONS)
+        if new_state not in allowed:
+            logger.warning("Invalid transition: %s -> %s (allowed: %s)", old_state, new_state, set(allowed))
+            return
+
+        self._state = new_state
+        logger.info("State: %s -> %s", old_state, new_state)
+
+        for cb in self._on_transition:
+            try:
+                cb(old_state, new_state)
+            except Exception:
+                logger.exception("Transition callback error")
 
 
     # Main loop: execute handler for current state, transition to returned state
@@ -4,6 +4,7 @@
 import asyncio
 import logging
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from andromeda.config import STTConfig
 
 logger = logging.getLogger("[ STT ]")
@@ -17,6 +18,10 @@ class SpeechRecognizer:
         self._speech_pad_ms = speech_pad_ms
         self._model = None
 
+        # One warm worker owned by STT: Whisper never competes with other
+        # default-executor work, and CTranslate2 thread-local state stays on one thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="andromeda-stt")
+
 
     # Load Whisper model. This downloads the model on first run
     def initialize(self) -> None:
@@ -27,6 +32,27 @@ class SpeechRecognizer:
         logger.info("Whisper model loaded successfully")
 
 
+    # Run a throwaway transcription on 1s of silence so the first real request
+    # doesn't pay CTranslate2's first-call allocations and page faults (blocking).
+    # Runs on the STT worker so the thread that will transcribe is the one warmed up
+    def warmup(self) -> None:
+        if self._model is None:
+            return
+
+        self._executor.submit(self._warmup_sync).result()
+
+
+    def _warmup_sync(self) -> None:
+        try:
+            silence = np.zeros(16000, dtype=np.float32)
+            segments, _info = self._model.transcribe(silence, language=self._cfg.language, beam_size=self._cfg.beam_size)
+            for _segment in segments:
+                pass
+            logger.info("Whisper warm-up completed")
+        except Exception:
+            logger.warning("Whisper warm-up failed", exc_info=True)
+
+
     # Transcribe audio array to text (runs blocking Whisper in executor)
     async def transcribe(self, audio: np.ndarray) -> str:
         if self._model is None:
@@ -40,7 +66,12 @@ class SpeechRecognizer:
 
         loop = asyncio.get_running_loop()
 
-        return await loop.run_in_executor(None, self._transcribe_sync, audio)
+        return await loop.run_in_executor(self._executor, self._transcribe_sync, audio)
+
+
+    # Release the transcription worker thread
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
     # Synchronous transcription (called from executor)
@@ -54,13 +85,15 @@ class SpeechRecognizer:
                 vad_parameters={"min_silence_duration_ms": 500, "speech_pad_ms": self._speech_pad_ms},
             )
 
-            # Collect all segment texts
+            # Collect all segment texts (segments are decoded lazily while iterating)
+            debug = logger.isEnabledFor(logging.DEBUG)
             texts = []
             for segment in segments:
                 text = segment.text.strip()
                 if text:
                     texts.append(text)
-                    logger.debug("Segment [%.1fs -> %.1fs]: %s", segment.start, segment.end, text)
+                    if debug:
+                        logger.debug("Segment [%.1fs -> %.1fs]: %s", segment.start, segment.end, text)
 
             result = " ".join(texts)
 
@@ -2,6 +2,9 @@
 # Licensed under MIT
 
 import logging
+import re
+import threading
+from functools import cache
 from andromeda.agent import AIAgent
 from andromeda.config import ToolsConfig
 from andromeda.feedback import AudioFeedback
@@ -41,6 +44,26 @@ _TOOLS = [
 ]
 
 
+# Fast intent patterns, compiled once at import rather than on every registration
+def _compile(*patterns: str) -> tuple[re.Pattern, ...]:
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+_TIME_PATTERNS = _compile(r"\b(che\s+)?or[ae]\b", r"\bche\s+ore\s+sono\b")
+_DATE_PATTERNS = _compile(r"\b(che\s+)?giorno\b", r"\b(che\s+)?data\b")
+# Gaps between keywords are bounded and lazy, so long non-matching utterances cannot backtrack badly
+_VOLUME_UP_PATTERNS = _compile(r"\b(?:alza[^\n]{0,40}?volume|volume[^\n]{0,40}?alto|più\s+forte)\b")
+_VOLUME_DOWN_PATTERNS = _compile(r"\b(?:abbassa[^\n]{0,40}?volume|volume[^\n]{0,40}?basso|più\s+piano)\b")
+_VOLUME_MUTE_PATTERNS = _compile(r"\bmut[ao]\b[^.?!]{0,40}?\b(?:volume|audio)\b", r"\b(?:volume|audio)\b[^.?!]{0,40}?\bmut[ao]\b", r"\bsilenzi[oa]\b")
+
+
+# bs4 is imported lazily by the tools; load it in the background so the first news/search request skips it.
+# Cached: the thread is started once per process however many times tools are registered
+@cache
+def _start_warmup() -> None:
+    threading.Thread(target=get_latest_news.warmup, name="andromeda-tools-warmup", daemon=True).start()
+
+
 # Register all available tools with the AI agent
 def register_all_tools(agent: AIAgent, tools_cfg: ToolsConfig, feedback: AudioFeedback) -> None:
     clear_intents()
@@ -62,15 +85,17 @@ def register_all_tools(agent: AIAgent, tools_cfg: ToolsConfig, feedback: AudioFe
         agent.register_tool(system_control.DEFINITION, system_control.handler)
 
     # Fast intents — bypass LLM for simple, deterministic requests
-    register_intent(patterns=[r"\b(che\s+)?or[ae]\b", r"\bche\s+ore\s+sono\b"], tool_handler=get_datetime.handler)
-    register_intent(patterns=[r"\b(che\s+)?giorno\b", r"\b(che\s+)?data\b"], tool_handler=get_datetime.handler)
+    register_intent(patterns=_TIME_PATTERNS, tool_handler=get_datetime.handler)
+    register_intent(patterns=_DATE_PATTERNS, tool_handler=get_datetime.handler)
     intents_count = 2
 
     if tools_cfg.allow_system_control:
-        register_intent(patterns=[r"\balza.*volume\b", r"\bvolume.*alto\b", r"\bpiù\s+forte\b"], tool_handler=system_control.handler, args={"action": "volume_up"})
-        register_intent(patterns=[r"\babbassa.*volume\b", r"\bvolume.*basso\b", r"\bpiù\s+piano\b"], tool_handler=system_control.handler, args={"action": "volume_down"})
-        register_intent(patterns=[r"\bmut[ao]\b.*\b(volume|audio)\b", r"\b(volume|audio)\b.*\bmut[ao]\b", r"\bsilenzi[oa]\b"], tool_handler=system_control.handler, args={"action": "volume_mute"})
+        register_intent(patterns=_VOLUME_UP_PATTERNS, tool_handler=system_control.handler, args={"action": "volume_up"})
+        register_intent(patterns=_VOLUME_DOWN_PATTERNS, tool_handler=system_control.handler, args={"action": "volume_down"})
+        register_intent(patterns=_VOLUME_MUTE_PATTERNS, tool_handler=system_control.handler, args={"action": "volume_mute"})
         intents_count += 3
 
+    _start_warmup()
+
     tools_count = len(_TOOLS) + (1 if tools_cfg.allow_system_control else 0)
     logger.info("Registered %d tools, %d fast intents", tools_count, intents_count)
@@ -4,9 +4,11 @@
 import os
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-import requests
+import httpx
+from andromeda.tools.http_client import get_client
 
 logger = logging.getLogger("[ TOOL TELEGRAM SEND MESSAGE ]")
 
@@ -106,7 +108,13 @@ def _get_token() -> str:
     return token
 
 
-def handler(_args: dict) -> str:
+# The token rarely rotates, so the endpoint string is built once per token
+@lru_cache(maxsize=4)
+def _send_message_url(token: str) -> str:
+    return f"https://api.telegram.org/bot{token}/sendMessage"
+
+
+async def handler(_args: dict) -> str:
     try:
         token = _get_token()
         chat_id = (_args.get("chat_id") or os.getenv("TELEGRAM_CHAT_ID", _TELEGRAM_DEFAULT_CHAT_ID)).strip()
@@ -117,7 +125,7 @@ def handler(_args: dict) -> str:
         if not text:
             return _err("Missing text")
 
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
+        url = _send_message_url(token)
 
         payload: Dict[str, Any] = {
             "chat_id": chat_id,
@@ -138,7 +146,9 @@ def handler(_args: dict) -> str:
         if _args.get("reply_to_message_id") is not None:
             payload["reply_parameters"] = {"message_id": int(_args["reply_to_message_id"])}
 
-        r = requests.post(url, json=payload, timeout=8)
+        # Shared async client: keeps the connection alive and does not block the event loop.
+        # Not retried: a resent sendMessage would deliver the message twice
+        r = await get_client().post(url, json=payload, timeout=8.0)
         data = r.json() if r.headers.get("content-type", "").startswith("application/json") else None
 
         if r.status_code != 200:
@@ -155,6 +165,6 @@ def handler(_args: dict) -> str:
             "date": result.get("date"),
         })
 
-    except (requests.RequestException, ValueError, TypeError, RuntimeError) as e:
+    except (httpx.HTTPError, ValueError, TypeError, RuntimeError) as e:
         logger.exception("Telegram sendMessage failed")
         return _err(str(e))
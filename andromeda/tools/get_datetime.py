@@ -3,7 +3,7 @@
 
 import logging
 from datetime import datetime
-from andromeda.messages import get_localized_datetime, msg
+from andromeda.messages import get_locale, get_localized_datetime, msg
 
 logger = logging.getLogger("[ TOOL GET DATETIME ]")
 
@@ -26,8 +26,20 @@ DEFINITION = {
 }
 
 
+# The answer only changes once a minute (or on locale switch), so repeated asks reuse it
+_last_key: tuple | None = None
+_last_result = ""
+
+
 def handler(_args: dict) -> str:
+    global _last_key, _last_result
     now = datetime.now()
+    key = (now.year, now.month, now.day, now.hour, now.minute, get_locale())
+    if key == _last_key:
+        return _last_result
+
     date_text, time_text = get_localized_datetime(now)
+    _last_result = msg("datetime.output", date=date_text, time=time_text)
+    _last_key = key
 
-    return msg("datetime.output", date=date_text, time=time_text)
+    return _last_result
@@ -1,13 +1,14 @@
 # Copyright (c) 2026 Alessandro Orrù
 # Licensed under MIT
 
+import hashlib
 import logging
-import re
 import time
 import httpx
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from bs4 import BeautifulSoup
+from functools import cache
 from andromeda.messages import msg
 from andromeda.tools.http_client import request_with_retry
 
@@ -16,12 +17,14 @@ logger = logging.getLogger("[ TOOL GET LATEST NEWS ]")
 
 _CACHE_TTL_SEC: float = 600.0
 _CACHE_MAX_SIZE: int = 50
+_PARSED_CACHE_MAX_SIZE: int = 8
 
 
 @dataclass
 class _NewsState:
     timeout_sec: float = 10.0
-    cache: dict[str, tuple[str, float]] = field(default_factory=dict)
+    cache: OrderedDict[str, tuple[str, float]] = field(default_factory=OrderedDict)  # (result, expires_at), LRU order
+    parsed: dict[tuple[bytes, int], list[dict]] = field(default_factory=dict)
 
 
 _state = _NewsState()
@@ -73,15 +76,31 @@ _CATEGORY_URLS = {
     "internet": "https://www.ilpost.it/internet/",
 }
 
-_ARTICLE_URL_RE = re.compile(
-    r"^https://www\.ilpost\.it/\d{4}/\d{2}/\d{2}/[\w-]+/?$",
-)
+# Article URLs look like https://www.ilpost.it/YYYY/MM/DD/<slug>/
+_ARTICLE_URL_PREFIX = "https://www.ilpost.it/"
+_DATE_START = len(_ARTICLE_URL_PREFIX)
+_SLUG_START = _DATE_START + len("YYYY/MM/DD/")
+_SLUG_SEPARATORS = str.maketrans("-_", "aa")
 
 
 def _normalize_href(href: str) -> str:
     return href.rstrip("/") + "/"
 
 
+# Fixed-offset check of a normalized href, equivalent to ^<prefix>\d{4}/\d{2}/\d{2}/[\w-]+/$
+def _is_article_url(href: str) -> bool:
+    if not href.startswith(_ARTICLE_URL_PREFIX) or not href.endswith("/"):
+        return False
+
+    date = href[_DATE_START:_SLUG_START]
+    if not (date[4:5] == date[7:8] == date[10:11] == "/"
+            and date[:4].isdecimal() and date[5:7].isdecimal() and date[8:10].isdecimal()):
+        return False
+
+    # str.isalnum() is exactly \w minus "_", so map the allowed separators to a letter
+    return href[_SLUG_START:-1].translate(_SLUG_SEPARATORS).isalnum()
+
+
 def _extract_summary(link_element, title: str) -> str:
     for sibling in link_element.parent.find_all(["p", "span"], recursive=True):
         text = sibling.get_text(strip=True)
@@ -92,8 +111,13 @@ def _extract_summary(link_element, title: str) -> str:
 
 
 def _parse_article(link) -> dict | None:
-    href = _normalize_href(link.get("href", ""))
-    if not _ARTICLE_URL_RE.match(href):
+    # Most links are navigation: reject anything not shaped like /<year>/... before normalizing
+    raw_href = link.get("href", "")
+    if not raw_href.startswith(_ARTICLE_URL_PREFIX) or not raw_href[_DATE_START:_DATE_START + 1].isdecimal():
+        return None
+
+    href = _normalize_href(raw_href)
+    if not _is_article_url(href):
         return None
 
     heading = link.select_one("h1, h2, h3, h4")
@@ -108,8 +132,49 @@ def _parse_article(link) -> dict | None:
     }
 
 
+# Pages often come back unchanged after the text cache expires: reuse the parse when the HTML digest matches
+def _parse_articles_cached(html: str, limit: int) -> list[dict]:
+    key = (hashlib.blake2b(html.encode(), digest_size=8).digest(), limit)
+    articles = _state.parsed.get(key)
+    if articles is not None:
+        logger.debug("News parse cache hit")
+        return articles
+
+    articles = _parse_articles(html, limit)
+    if len(_state.parsed) >= _PARSED_CACHE_MAX_SIZE:
+        del _state.parsed[next(iter(_state.parsed))]  # Evict the oldest insertion
+    _state.parsed[key] = articles
+
+    return articles
+
+
+# Prefer bs4's C-backed lxml parser when installed (speed extra), falling back to pure-Python html.parser.
+# Probed on first parse so neither import weighs on assistant startup
+@cache
+def _html_parser() -> str:
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+
+    return "lxml"
+
+
+# Load bs4 and its tree builder ahead of the first request (called off-thread at startup)
+def warmup() -> None:
+    try:
+        from bs4 import BeautifulSoup
+
+        BeautifulSoup("<a href='#'><h2></h2></a>", _html_parser()).select("a[href]")
+        logger.debug("HTML parser warm-up completed")
+    except Exception:
+        logger.warning("HTML parser warm-up failed", exc_info=True)
+
+
 def _parse_articles(html: str, limit: int) -> list[dict]:
-    soup = BeautifulSoup(html, "html.parser")
+    from bs4 import BeautifulSoup  # Deferred: bs4 is a ~45ms import only news/search requests need
+
+    soup = BeautifulSoup(html, _html_parser())
     seen_urls: set[str] = set()
     articles: list[dict] = []
 
@@ -135,7 +200,8 @@ async def _fetch_page(url: str) -> str:
 
 def configure(timeout_sec: float) -> None:
     _state.timeout_sec = timeout_sec
-    _state.cache = {}
+    _state.cache = OrderedDict()
+    _state.parsed = {}
 
 
 async def handler(args: dict) -> str:
@@ -147,29 +213,29 @@ async def handler(args: dict) -> str:
     cache_key = f"{category}:{limit}"
     cached = _state.cache.get(cache_key)
     if cached is not None:
-        result, ts = cached
-        if (time.monotonic() - ts) < _CACHE_TTL_SEC:
+        result, expires_at = cached
+        if time.monotonic() < expires_at:
             logger.debug("News cache hit for '%s'", cache_key)
+            _state.cache.move_to_end(cache_key)
             return result
 
     try:
         html = await _fetch_page(url)
-        articles = _parse_articles(html, limit)
+        articles = _parse_articles_cached(html, limit)
 
         if not articles:
             return msg("news.none_found", category=category)
 
         now = datetime.now().strftime("%d/%m/%Y %H:%M")
-        news = msg("news.output_header", category=category.upper(), now=now)
-        for i, art in enumerate(articles, 1):
-            news = news + str(i) + ": " + art['title'] + ". "
-
-        # Cache the result (evict oldest if full)
-        if len(_state.cache) >= _CACHE_MAX_SIZE:
-            oldest_key = min(_state.cache, key=lambda k: _state.cache[k][1])
-            del _state.cache[oldest_key]
-
-        _state.cache[cache_key] = (news, time.monotonic())
+        parts = [msg("news.output_header", category=category.upper(), now=now)]
+        parts.extend(f"{i}: {art['title']}. " for i, art in enumerate(articles, 1))
+        news = "".join(parts)
+
+        # Cache the result (evict least recently used if full)
+        _state.cache[cache_key] = (news, time.monotonic() + _CACHE_TTL_SEC)
+        _state.cache.move_to_end(cache_key)
+        if len(_state.cache) > _CACHE_MAX_SIZE:
+            _state.cache.popitem(last=False)
 
         return news
 
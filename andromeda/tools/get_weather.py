@@ -4,6 +4,7 @@
 import logging
 import time
 import httpx
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from andromeda.messages import msg, weather_condition
 from andromeda.tools.http_client import request_with_retry
@@ -13,12 +14,18 @@ logger = logging.getLogger("[ TOOL GET WEATHER ]")
 
 _CACHE_TTL_SEC: float = 300.0
 _CACHE_MAX_SIZE: int = 50
+_GEO_CACHE_MAX_SIZE: int = 100
+
+_GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
+_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+_FORECAST_PARAMS = {"current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m", "timezone": "auto"}
 
 
 @dataclass
 class _WeatherState:
     timeout_sec: float = 10.0
-    cache: dict[str, tuple[str, float]] = field(default_factory=dict)
+    cache: OrderedDict[str, tuple[str, float]] = field(default_factory=OrderedDict)  # (result, expires_at), LRU order
+    geo: OrderedDict[str, tuple[float, float, str]] = field(default_factory=OrderedDict)  # (lat, lon, name), no TTL
 
 
 _state = _WeatherState()
@@ -47,7 +54,29 @@ DEFINITION = {
 
 def configure(timeout_sec: float) -> None:
     _state.timeout_sec = timeout_sec
-    _state.cache = {}
+    _state.cache = OrderedDict()
+    _state.geo = OrderedDict()
+
+
+# Resolve a city to (lat, lon, name). Coordinates never change, so known cities skip the geocoding round trip
+async def _geocode(city: str, cache_key: str) -> tuple[float, float, str] | None:
+    location = _state.geo.get(cache_key)
+    if location is not None:
+        _state.geo.move_to_end(cache_key)
+        return location
+
+    geo_resp = await request_with_retry("GET", _GEOCODE_URL, params={"name": city, "count": 1, "language": "it"}, timeout_sec=_state.timeout_sec)
+    results = geo_resp.json().get("results", [])
+    if not results:
+        return None
+
+    loc = results[0]
+    location = (loc["latitude"], loc["longitude"], loc.get("name", city))
+    _state.geo[cache_key] = location
+    if len(_state.geo) > _GEO_CACHE_MAX_SIZE:
+        _state.geo.popitem(last=False)
+
+    return location
 
 
 async def handler(args: dict) -> str:
@@ -59,25 +88,20 @@ async def handler(args: dict) -> str:
     cache_key = city.lower()
     cached = _state.cache.get(cache_key)
     if cached is not None:
-        result, ts = cached
-        if (time.monotonic() - ts) < _CACHE_TTL_SEC:
+        result, expires_at = cached
+        if time.monotonic() < expires_at:
             logger.debug("Weather cache hit for '%s'", city)
+            _state.cache.move_to_end(cache_key)
             return result
 
     try:
-        # Geocode city name to coordinates
-        geo_resp = await request_with_retry("GET", "https://geocoding-api.open-meteo.com/v1/search", params={"name": city, "count": 1, "language": "it"}, timeout_sec=_state.timeout_sec)
-        geo_data = geo_resp.json()
-        results = geo_data.get("results", [])
-        if not results:
+        location = await _geocode(city, cache_key)
+        if location is None:
             return msg("weather.city_not_found", city=city)
-
-        loc = results[0]
-        lat, lon = loc["latitude"], loc["longitude"]
-        city_name = loc.get("name", city)
+        lat, lon, city_name = location
 
         # Fetch current weather
-        weather_resp = await request_with_retry("GET", "https://api.open-meteo.com/v1/forecast", params={"latitude": lat, "longitude": lon, "current": "temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m", "timezone": "auto"}, timeout_sec=_state.timeout_sec)
+        weather_resp = await request_with_retry("GET", _FORECAST_URL, params={"latitude": lat, "longitude": lon, **_FORECAST_PARAMS}, timeout_sec=_state.timeout_sec)
         weather_data = weather_resp.json()
         current = weather_data.get("current", {})
         temp = current.get("temperature_2m", "N/D")
@@ -87,12 +111,11 @@ async def handler(args: dict) -> str:
         condition = weather_condition(code)
         result = msg("weather.output", city=city_name, condition=condition, temp=temp, humidity=humidity, wind=wind)
 
-        # Cache the result (evict oldest if full)
-        if len(_state.cache) >= _CACHE_MAX_SIZE:
-            oldest_key = min(_state.cache, key=lambda k: _state.cache[k][1])
-            del _state.cache[oldest_key]
-
-        _state.cache[cache_key] = (result, time.monotonic())
+        # Cache the result (evict least recently used if full)
+        _state.cache[cache_key] = (result, time.monotonic() + _CACHE_TTL_SEC)
+        _state.cache.move_to_end(cache_key)
+        if len(_state.cache) > _CACHE_MAX_SIZE:
+            _state.cache.popitem(last=False)
 
         return result
 
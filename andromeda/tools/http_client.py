@@ -5,6 +5,7 @@ import logging
 import asyncio
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse
 import httpx
 
@@ -20,8 +21,19 @@ _HEADERS = {
     "Accept-Language": "it-IT,it;q=0.9,en;q=0.8",
 }
 
+# Tool calls are seconds to minutes apart, so keep idle connections longer than httpx's 5s default
+# to let consecutive requests (e.g. geocode + forecast, follow-up questions) skip the TLS handshake
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+
+
+@dataclass(slots=True)
+class _CircuitState:
+    fails: int = 0
+    open_until: float = 0.0
+
+
 _client: httpx.AsyncClient | None = None
-_circuit_state: dict[str, dict[str, float]] = {}
+_circuit_state: dict[str, _CircuitState] = {}
 _CIRCUIT_FAIL_THRESHOLD = 3
 _CIRCUIT_OPEN_SEC = 20.0
 
@@ -30,12 +42,14 @@ _CIRCUIT_OPEN_SEC = 20.0
 def get_client() -> httpx.AsyncClient:
     global _client
     if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(headers=_HEADERS, timeout=httpx.Timeout(15.0, connect=5.0), follow_redirects=True)
+        _client = httpx.AsyncClient(headers=_HEADERS, timeout=httpx.Timeout(15.0, connect=5.0), limits=_LIMITS, follow_redirects=True)
         logger.debug("Shared HTTP client created")
 
     return _client
 
 
+# Tool endpoints are a small repeating set (fetched pages are bounded by maxsize), so parse each URL once
+@lru_cache(maxsize=256)
 def _circuit_key(url: str) -> str:
     parsed = urlparse(url)
 
@@ -44,26 +58,28 @@ def _circuit_key(url: str) -> str:
 
 def _is_circuit_open(key: str) -> bool:
     state = _circuit_state.get(key)
-    if not state:
+    if state is None:
         return False
 
-    return state.get("open_until", 0.0) > time.monotonic()
+    return state.open_until > time.monotonic()
 
 
 def _mark_success(key: str) -> None:
-    if key in _circuit_state:
-        _circuit_state[key] = {"fails": 0.0, "open_until": 0.0}
+    state = _circuit_state.get(key)
+    if state is not None:
+        state.fails = 0
+        state.open_until = 0.0
 
 
 def _mark_failure(key: str) -> None:
-    state = _circuit_state.get(key, {"fails": 0.0, "open_until": 0.0})
-    fails = state["fails"] + 1.0
-    open_until = state["open_until"]
-    if fails >= _CIRCUIT_FAIL_THRESHOLD:
-        open_until = time.monotonic() + _CIRCUIT_OPEN_SEC
-        logger.warning("Circuit opened for %s", key)
+    state = _circuit_state.get(key)
+    if state is None:
+        state = _circuit_state[key] = _CircuitState()
 
-    _circuit_state[key] = {"fails": fails, "open_until": open_until}
+    state.fails += 1
+    if state.fails >= _CIRCUIT_FAIL_THRESHOLD:
+        state.open_until = time.monotonic() + _CIRCUIT_OPEN_SEC
+        logger.warning("Circuit opened for %s", key)
 
 
 def _is_retryable_status(status_code: int) -> bool:
@@ -30,6 +30,8 @@ _SENSITIVE_PATTERNS = (
 class _KnowledgeBaseState:
     store_path: str = "data/knowledge.json"
     cache: dict | None = None
+    cache_signature: tuple[int, int] | None = None  # (st_mtime_ns, st_size) the cache reflects (None: file absent)
+    lowered_keys: list[tuple[str, str]] | None = None  # (key.lower(), key) for fuzzy recall, rebuilt lazily
     allow_sensitive_memory: bool = False
     lock: threading.RLock = field(default_factory=threading.RLock)
 
@@ -87,6 +89,8 @@ def configure(store_path: str, allow_sensitive_memory: bool = False) -> None:
     with _state.lock:
         _state.store_path = store_path
         _state.cache = None
+        _state.cache_signature = None
+        _state.lowered_keys = None
         _state.allow_sensitive_memory = allow_sensitive_memory
 
 
@@ -98,23 +102,39 @@ def _is_sensitive_text(text: str) -> bool:
     return False
 
 
-def _load_store() -> dict:
+# Stat signature of the store file, or None if it does not exist. Size catches edits within one mtime tick
+def _store_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Serve the parsed store from memory, reparsing only when the file changes on disk (e.g. edited by hand).
+# Returns None if the file exists but cannot be parsed: nothing is cached, so it is never written over
+def _load_store() -> dict | None:
     with _state.lock:
-        if _state.cache is not None:
+        path = Path(_state.store_path)
+        signature = _store_signature(path)
+        if _state.cache is not None and signature == _state.cache_signature:
             return _state.cache
 
-        path = Path(_state.store_path)
-        if not path.exists():
-            _state.cache = {}
+        _state.lowered_keys = None
+        if signature is None:
+            _state.cache, _state.cache_signature = {}, None
             return _state.cache
         try:
-            _state.cache = json.loads(path.read_text(encoding="utf-8"))
-            logger.debug("Knowledge base loaded from disk: %d entries", len(_state.cache))
-            return _state.cache
+            store = json.loads(path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
             logger.warning("Failed to load knowledge base from %s", path)
-            _state.cache = {}
-            return _state.cache
+            _state.cache, _state.cache_signature = None, None
+            return None
+
+        _state.cache, _state.cache_signature = store, signature
+        logger.debug("Knowledge base loaded from disk: %d entries", len(store))
+        return store
 
 
 def _save_store(data: dict) -> None:
@@ -135,6 +155,8 @@ def _save_store(data: dict) -> None:
 
         # Update in-memory cache after successful write
         _state.cache = data
+        _state.cache_signature = _store_signature(path)
+        _state.lowered_keys = None
 
 
 def _action_save(store: dict, key: str, value: str, allow_sensitive: bool) -> str:
@@ -164,7 +186,10 @@ def _action_recall(store: dict, key: str) -> str:
         return f"{key}: {result}"
 
     # Fuzzy search: check if key is substring of any stored key
-    matches = {k: v for k, v in store.items() if key.lower() in k.lower()}
+    if _state.lowered_keys is None:
+        _state.lowered_keys = [(k.lower(), k) for k in store]
+    key_lower = key.lower()
+    matches = {k: store[k] for k_lower, k in _state.lowered_keys if key_lower in k_lower}
     if not matches:
         return msg("kb.recall_not_found", key=key)
 
@@ -212,6 +237,9 @@ def handler(args: dict) -> str:
         return msg("kb.invalid_action", action=action)
 
     with _state.lock:
+        store = _load_store()
+        if store is None:
+            return msg("kb.store_unreadable", path=_state.store_path)
         if action == "save":
-            return action_fn(_load_store(), key, value, allow_sensitive)
-        return action_fn(_load_store(), key, value)
+            return action_fn(store, key, value, allow_sensitive)
+        return action_fn(store, key, value)
@@ -8,7 +8,6 @@ import time
 import httpx
 from dataclasses import dataclass, field
 from urllib.parse import parse_qs, unquote, urlparse
-from bs4 import BeautifulSoup
 from andromeda.messages import msg
 from andromeda.tools.http_client import request_with_retry
 
@@ -120,6 +119,8 @@ def _extract_url(raw_href: str) -> str:
 
 # Parse DuckDuckGo HTML lite results
 def _parse_search_results(html: str, limit: int) -> list[dict]:
+    from bs4 import BeautifulSoup  # Deferred: bs4 is a ~45ms import only news/search requests need
+
     soup = BeautifulSoup(html, "html.parser")
     results: list[dict] = []
 
@@ -155,6 +156,8 @@ async def _fetch_and_extract(url: str) -> str:
         logger.debug("Failed to fetch page content from %s", url)
         return ""
 
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(resp.text, "html.parser")
 
     # Remove non-content elements
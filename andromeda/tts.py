@@ -24,9 +24,20 @@ logger = logging.getLogger("[ TTS ]")
 # Fade duration in samples applied to the end of each sentence to prevent audio pops
 _FADE_SAMPLES = 64
 
-# Max entries in the TTS audio cache
+# Max entries in the TTS audio cache (pre-warmed phrases are pinned and don't count)
 _TTS_CACHE_MAX = 64
 
+# Fixed phrases spoken by the assistant itself, synthesized once at startup
+_PREWARM_MESSAGE_KEYS = (
+    "core.no_speech_retry",
+    "core.not_understood_retry",
+    "core.generic_error_retry",
+    "core.processing_error_retry",
+    "agent.ollama_unreachable",
+    "agent.ollama_timeout",
+    "agent.request_too_complex",
+)
+
 
 # Local text-to-speech using Piper
 # Models: https://github.com/rhasspy/piper/blob/master/VOICES.md
@@ -121,20 +132,16 @@ class TextToSpeech:
 
     # Pre-warm the TTS cache with commonly used phrases
     def prewarm_cache(self, phrases: list[str] | None = None) -> None:
-        default_phrases = [
-            msg("core.no_speech_retry"),
-            msg("core.not_understood_retry"),
-            msg("core.generic_error_retry"),
-        ]
+        default_phrases = [msg(key) for key in _PREWARM_MESSAGE_KEYS]
         for text in (phrases or default_phrases):
             key = self._cache_key(text)
             if key not in self._cache:
                 try:
                     audio, sr = self._synthesize(text)
-                    self._cache_put(key, audio, sr)
-                    logger.debug("TTS cache pre-warmed: %s", text[:40])
+                    self._cache_put(key, audio, sr, pinned=True)
+                    logger.debug("TTS cache pre-warmed: %.40s", text)
                 except Exception:
-                    logger.warning("Failed to pre-warm TTS cache for: %s", text[:40])
+                    logger.warning("Failed to pre-warm TTS cache for: %.40s", text)
 
         logger.info("TTS cache pre-warmed with %d phrases", len(self._cache))
 
@@ -146,7 +153,7 @@ class TextToSpeech:
 
         self._is_speaking = True
         self._stop_event.clear()
-        logger.info("TTS speaking: %s", text[:80])
+        logger.info("TTS speaking: %.80s", text)
 
         try:
             await self._speak(text)
@@ -189,7 +196,8 @@ class TextToSpeech:
                         break
                     audio, sample_rate = await self._synthesize_cached(loop, sentence)
 
-                logger.info("TTS streaming sentence: %s", " ".join(sentence[:200].split()))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("TTS streaming sentence: %s", " ".join(sentence[:200].split()))
 
                 # Start prefetching the next sentence immediately
                 prefetch_task = asyncio.create_task(
@@ -222,12 +230,16 @@ class TextToSpeech:
 
 
     # Consume next valid sentence from the queue; returns None on stop/end-of-stream
+    # Already-queued sentences are taken without the wait_for task wrapper
     async def _next_sentence(self, queue: asyncio.Queue) -> str | None:
         while not self._stop_event.is_set():
             try:
-                sentence = await asyncio.wait_for(queue.get(), timeout=0.2)
-            except asyncio.TimeoutError:
-                continue
+                sentence = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                try:
+                    sentence = await asyncio.wait_for(queue.get(), timeout=0.2)
+                except asyncio.TimeoutError:
+                    continue
 
             if sentence is None:
                 return None
@@ -312,7 +324,7 @@ class TextToSpeech:
         # Check cache first
         cached = self._cache.get(key)
         if cached is not None:
-            logger.debug("TTS cache hit: %s", text[:40])
+            logger.debug("TTS cache hit: %.40s", text)
             return cached[0].copy(), cached[1]
 
         # Synthesize and cache
@@ -455,14 +467,18 @@ class TextToSpeech:
         return text.strip().lower()
 
 
-    def _cache_put(self, key: str, audio: np.ndarray, sample_rate: int) -> None:
+    # Pinned entries are never evicted, so fixed phrases always skip synthesis
+    def _cache_put(self, key: str, audio: np.ndarray, sample_rate: int, pinned: bool = False) -> None:
         if key in self._cache:
             return
 
-        if len(self._cache) >= _TTS_CACHE_MAX:
+        self._cache[key] = (audio.copy(), sample_rate)
+        if pinned:
+            return
+
+        if len(self._cache_order) >= _TTS_CACHE_MAX:
             oldest = self._cache_order.popleft()
             self._cache.pop(oldest, None)
-        self._cache[key] = (audio.copy(), sample_rate)
         self._cache_order.append(key)
 
 
@@ -20,6 +20,10 @@ class VoiceActivityDetector:
         self._vad_cfg = vad_cfg
         self._vad = webrtcvad.Vad(vad_cfg.aggressiveness)
 
+        # Bound once: process_frame runs every 10-30ms on the audio thread
+        self._is_speech = self._vad.is_speech
+        self._sample_rate = audio_cfg.sample_rate
+
         # State tracking
         self._is_active = False
         self._speech_detected = False
@@ -30,6 +34,9 @@ class VoiceActivityDetector:
         self._energy_threshold: float = 0.0
         self._last_decay_time: float = 0.0
 
+        # Reusable float32 buffer for the per-frame energy computation
+        self._scratch = np.empty(audio_cfg.chunk_samples, dtype=np.float32)
+
         # Events
         self._speech_ended = threading.Event()
         self._lock = threading.Lock()
@@ -64,21 +71,33 @@ class VoiceActivityDetector:
             self._speech_ended.set()
 
 
+    # RMS energy of an int16 frame, converted into the preallocated scratch buffer
+    # so the audio thread does not allocate temporary float arrays per frame
+    def _frame_rms(self, frame_array: np.ndarray) -> float:
+        n = frame_array.shape[0]
+        if n == 0:
+            return 0.0
+        if n != self._scratch.shape[0]:
+            self._scratch = np.empty(n, dtype=np.float32)
+
+        np.copyto(self._scratch, frame_array)
+        return float(np.sqrt(np.dot(self._scratch, self._scratch) / n))
+
+
     # Process audio frame for speech detection. Called from audio thread
     def process_frame(self, frame_bytes: bytes, frame_array: np.ndarray) -> None:
         if not self._is_active:
             return
 
         try:
-            is_speech = self._vad.is_speech(frame_bytes, sample_rate=self._audio_cfg.sample_rate)
+            is_speech = self._is_speech(frame_bytes, self._sample_rate)
         except Exception:
             return
 
         # Energy gate: reject speech frames below threshold
         if is_speech and self._energy_threshold > 0.0:
             try:
-                rms = float(np.sqrt(np.mean(frame_array.astype(np.float32) ** 2)))
-                if rms < self._energy_threshold:
+                if self._frame_rms(frame_array) < self._energy_threshold:
                     is_speech = False
             except Exception:
                 pass  # Never crash the audio callback
@@ -121,6 +140,12 @@ class VoiceActivityDetector:
         return self._speech_ended.wait(timeout=timeout)
 
 
+    # Whether VAD is currently monitoring. Lock-free read for the audio callback
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+
+
     # Whether any speech was detected during this monitoring session
     @property
     def had_speech(self) -> bool:
@@ -1,7 +1,10 @@
 # Copyright (c) 2026 Alessandro Orrù
 # Licensed under MIT
 
+import asyncio
+import contextlib
 import logging
+import operator
 import threading
 import time
 import numpy as np
@@ -10,6 +13,9 @@ from andromeda.config import AudioConfig, WakeWordConfig
 
 logger = logging.getLogger("[ WAKE WORD ]")
 
+# Sort key for (model_name, score) prediction items
+_score_of = operator.itemgetter(1)
+
 
 # Detects custom wake word from audio frames using OpenWakeWord
 # Custom word how-to: https://github.com/dscripka/openwakeword?tab=readme-ov-file#training-new-models
@@ -21,6 +27,8 @@ class WakeWordDetector:
         self._wake_cfg = wake_cfg
         self._model = None
         self._detected = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_detected: asyncio.Event | None = None  # Mirrors _detected for async waiters
         self._shutdown = False
         self._lock = threading.Lock()
         self._last_debug_log: float = 0.0
@@ -32,15 +40,19 @@ class WakeWordDetector:
             import openwakeword
             from openwakeword.model import Model
 
-            openwakeword.utils.download_models()
             model_path = Path(self._wake_cfg.model_path)
 
+            # Only fetch what this run needs: download_models() always ensures the shared
+            # feature models, and with no names it would also check (and download if missing)
+            # every official wake word model
             if model_path.exists():
                 # Defined model
+                openwakeword.utils.download_models(model_names=[model_path.name])
                 self._model = Model(wakeword_models=[str(model_path)], inference_framework="onnx")
                 logger.info("Loaded custom wake word model: %s", model_path)
             else:
                 # Fallback: built-in model "hey_jarvis"
+                openwakeword.utils.download_models(model_names=["hey_jarvis"])
                 self._model = Model(wakeword_models=["hey_jarvis"], inference_framework="onnx")
                 logger.warning("Custom model not found at %s, using built-in 'hey_jarvis'", model_path)
 
@@ -58,33 +70,44 @@ class WakeWordDetector:
             with self._lock:
                 prediction = self._model.predict(frame_array)
 
-            # Check all model predictions against threshold
-            for model_name, score in prediction.items():
-                if score > self._wake_cfg.threshold:
-                    logger.info("Wake word detected: %s (score=%.3f)", model_name, score)
-                    self._detected.set()
+            if not prediction:
+                return
+
+            # Only the best-scoring model can trigger: one C-level max, one comparison
+            model_name, score = max(prediction.items(), key=_score_of)
+            if score > self._wake_cfg.threshold:
+                logger.info("Wake word detected: %s (score=%.3f)", model_name, score)
+                self._signal_detected()
 
-                    # Reset model state to avoid repeated triggers
-                    with self._lock:
-                        self._model.reset()
+                # Reset model state to avoid repeated triggers
+                with self._lock:
+                    self._model.reset()
 
-                    return
+                return
 
             # Periodic debug logging of max prediction score (every 3s)
             now = time.monotonic()
             if now - self._last_debug_log >= 3.0:
-                max_score = max(prediction.values()) if prediction else 0.0
-                if max_score > 0.01:
-                    logger.debug("Wake word max score: %.3f (threshold=%.2f)", max_score, self._wake_cfg.threshold)
+                if score > 0.01:
+                    logger.debug("Wake word max score: %.3f (threshold=%.2f)", score, self._wake_cfg.threshold)
                 self._last_debug_log = now
 
         except Exception:
             logger.debug("Wake word prediction error", exc_info=True)
 
 
-    # Block until wake word is detected. Returns True if detected, False on shutdown/timeout
-    def wait_for_detection(self, timeout: float | None = None) -> bool:
-        self._detected.wait(timeout=timeout)
+    # Await wake word detection on the event loop without parking an executor thread
+    # The audio thread wakes the waiter with a single call_soon_threadsafe hop
+    async def wait_for_detection_async(self, timeout: float | None = None) -> bool:
+        if self._async_detected is None:
+            self._loop = asyncio.get_running_loop()
+            self._async_detected = asyncio.Event()
+
+        if not self._detected.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._async_detected.wait(), timeout)
+
+        self._async_detected.clear()
         if self._shutdown:
             return False
 
@@ -94,9 +117,21 @@ class WakeWordDetector:
         return detected
 
 
+    # Set the detection event and wake any async waiter. Safe from any thread
+    def _signal_detected(self) -> None:
+        self._detected.set()
+        loop = self._loop
+        if loop is not None and self._async_detected is not None:
+            # Loop already closed
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._async_detected.set)
+
+
     # Reset detection state
     def reset(self) -> None:
         self._detected.clear()
+        if self._async_detected is not None:
+            self._async_detected.clear()
         if self._model:
             with self._lock:
                 self._model.reset()
@@ -113,4 +148,4 @@ class WakeWordDetector:
     # Unblock any waiting thread and prevent further detections
     def shutdown(self) -> None:
         self._shutdown = True
-        self._detected.set()
+        self._signal_detected()
@@ -258,6 +258,34 @@ class TestBuildPayload:
         assert "tools" not in payload
 
 
+class TestPrefill:
+    @pytest.mark.asyncio
+    async def test_prefill_without_init_is_noop(self):
+        agent = AIAgent(AgentConfig())
+        await agent.prefill()  # Should not raise
+
+    @pytest.mark.asyncio
+    async def test_prefill_sends_prefix_with_single_token(self):
+        agent = AIAgent(AgentConfig(system_prompt="sys"))
+        agent._tools = [{"function": {"name": "test"}}]
+        agent._conversation = [{"role": "user", "content": "ciao"}, {"role": "assistant", "content": "ciao!"}]
+        agent._client = MagicMock(post=AsyncMock(return_value=MagicMock()))
+
+        await agent.prefill()
+
+        payload = agent._client.post.await_args.kwargs["json"]
+        assert payload["messages"][0] == {"role": "system", "content": "sys"}
+        assert payload["messages"][1:] == agent._conversation
+        assert payload["options"] == {"num_predict": 1}
+        assert payload["tools"] == agent._tools
+
+    @pytest.mark.asyncio
+    async def test_prefill_swallows_errors(self):
+        agent = AIAgent(AgentConfig())
+        agent._client = MagicMock(post=AsyncMock(side_effect=RuntimeError("down")))
+        await agent.prefill()  # Should not raise
+
+
 class TestHistoryTrimming:
     @pytest.mark.asyncio
     async def test_history_trimmed(self):
@@ -35,6 +35,39 @@ class TestMuteUnmute:
         cap.unmute()
         assert cap._route_mode == AudioRouteMode.NORMAL
 
+    def test_nested_mute_requests(self):
+        cap = AudioCapture(AudioConfig(), NoiseConfig())
+        cap.request_mute()
+        cap.request_mute()
+        cap.release_mute()
+        assert cap._route_mode == AudioRouteMode.MUTED
+        cap.release_mute()
+        assert cap._route_mode == AudioRouteMode.NORMAL
+
+    def test_release_without_request_is_noop(self):
+        cap = AudioCapture(AudioConfig(), NoiseConfig())
+        cap.monitor_only()
+        cap.release_mute()
+        assert cap._route_mode == AudioRouteMode.MONITOR_ONLY
+
+    def test_unmute_drops_pending_requests(self):
+        cap = AudioCapture(AudioConfig(), NoiseConfig())
+        cap.request_mute()
+        cap.unmute()
+        cap.release_mute()
+        assert cap._route_mode == AudioRouteMode.NORMAL
+        assert cap._mute_depth == 0
+
+    def test_muted_context_nests_and_releases_on_error(self):
+        cap = AudioCapture(AudioConfig(), NoiseConfig())
+        with pytest.raises(RuntimeError), cap.muted():
+            with cap.muted():
+                assert cap._mute_depth == 2
+            assert cap._route_mode == AudioRouteMode.MUTED
+            raise RuntimeError("boom")
+        assert cap._route_mode == AudioRouteMode.NORMAL
+        assert cap._mute_depth == 0
+
 
 class TestRecording:
     def test_start_recording(self):
@@ -62,6 +95,7 @@ class TestRecording:
         assert isinstance(audio, np.ndarray)
         assert len(audio) == 960  # 480 * 2
         assert audio.dtype == np.float32
+        assert audio[0] == pytest.approx(1000 / 32768.0)
 
     def test_stop_recording_clears_buffer(self):
         cap = AudioCapture(AudioConfig(), NoiseConfig(enabled=False))
@@ -168,3 +202,27 @@ class TestCalibrateSpeechEnergy:
 
         energy = cap.calibrate_speech_energy(mock_vad, 16000)
         assert energy > 0.0
+
+    def test_median_of_per_frame_rms(self):
+        cap = AudioCapture(AudioConfig(), NoiseConfig(enabled=False))
+        mock_vad = MagicMock()
+        mock_vad.is_speech.return_value = True
+
+        for amplitude in (1000, 2000, 9000):
+            cap._ring_buffer.append(struct.pack("<480h", *([amplitude] * 480)))
+
+        energy = cap.calibrate_speech_energy(mock_vad, 16000)
+        assert energy == pytest.approx(2000.0)
+
+    def test_mixed_frame_sizes_use_per_frame_rms(self):
+        cap = AudioCapture(AudioConfig(), NoiseConfig(enabled=False))
+        mock_vad = MagicMock()
+        mock_vad.is_speech.return_value = True
+
+        # 720 + 240 + 480 samples: total divides by 3, so a blind reshape would straddle frames
+        cap._ring_buffer.append(struct.pack("<720h", *([1000] * 720)))
+        cap._ring_buffer.append(struct.pack("<240h", *([2000] * 240)))
+        cap._ring_buffer.append(struct.pack("<480h", *([9000] * 480)))
+
+        energy = cap.calibrate_speech_energy(mock_vad, 16000)
+        assert energy == pytest.approx(2000.0)
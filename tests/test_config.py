@@ -132,6 +132,10 @@ class TestAgentConfig:
         with pytest.raises(ValueError, match="max_tokens"):
             AgentConfig(max_tokens=0)
 
+    def test_invalid_prefix_refresh_sec(self):
+        with pytest.raises(ValueError, match="prefix_refresh_sec"):
+            AgentConfig(prefix_refresh_sec=-1)
+
 
 class TestConversationConfig:
     def test_defaults(self):
@@ -1,6 +1,7 @@
 # Copyright (c) 2026 Alessandro Orrù
 # Licensed under MIT
 
+import threading
 from unittest.mock import patch
 import numpy as np
 import pytest
@@ -83,6 +84,7 @@ class TestPlay:
         fb = AudioFeedback(AudioConfig(), FeedbackConfig())
         fb.initialize()
         fb.play("wake")
+        fb._cues.join()
         mock_sd_play.assert_called_once()
 
     @patch("sounddevice.play", side_effect=Exception("device error"))
@@ -90,6 +92,8 @@ class TestPlay:
         fb = AudioFeedback(AudioConfig(), FeedbackConfig())
         fb.initialize()
         fb.play("wake")  # Should not raise despite error
+        fb._cues.join()
+        assert fb._cue_thread.is_alive()
 
     @patch("sounddevice.play")
     def test_play_blocking(self, mock_sd_play):
@@ -100,3 +104,28 @@ class TestPlay:
         # Check blocking=True was passed
         _, kwargs = mock_sd_play.call_args
         assert kwargs.get("blocking") is True
+
+    @patch("sounddevice.play")
+    def test_play_blocking_queued_after_pending_cues(self, mock_sd_play):
+        fb = AudioFeedback(AudioConfig(), FeedbackConfig())
+        fb.initialize()
+        fb.play("wake")
+        fb.play_blocking("done")
+        played = [call.args[0] for call in mock_sd_play.call_args_list]
+        assert played[0] is fb._sounds["wake"]
+        assert played[1] is fb._sounds["done"]
+        assert mock_sd_play.call_args_list[1].kwargs["blocking"] is True
+
+    @patch("sounddevice.play")
+    def test_concurrent_play_starts_one_worker(self, _mock_sd_play):
+        fb = AudioFeedback(AudioConfig(), FeedbackConfig())
+        fb.initialize()
+        with patch("andromeda.feedback.threading.Thread", wraps=threading.Thread) as thread:
+            callers = [threading.Thread(target=fb.play, args=("wake",)) for _ in range(8)]
+            for caller in callers:
+                caller.start()
+            for caller in callers:
+                caller.join()
+        fb._cues.join()
+        worker_starts = [c for c in thread.call_args_list if c.kwargs.get("name") == "andromeda-feedback"]
+        assert len(worker_starts) == 1
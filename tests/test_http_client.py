@@ -83,3 +83,19 @@ class TestHttpClientResilience:
             await http_client.request_with_retry("GET", "https://example.com", retries=0)
         with pytest.raises(RuntimeError, match="Circuit open"):
             await http_client.request_with_retry("GET", "https://example.com", retries=0)
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failure_count(self, monkeypatch):
+        client = FlakyClient()
+        monkeypatch.setattr(http_client, "get_client", lambda: client)
+
+        await http_client.request_with_retry("GET", "https://example.com", retries=2, backoff_sec=0)
+
+        state = http_client._circuit_state["example.com"]
+        assert state.fails == 0
+        assert state.open_until == 0.0
+
+    def test_circuit_key_is_host(self):
+        assert http_client._circuit_key("https://api.open-meteo.com/v1/forecast?x=1") == "api.open-meteo.com"
+        assert http_client._circuit_key("https://api.open-meteo.com/v1/forecast?x=1") == "api.open-meteo.com"
+        assert http_client._circuit_key.cache_info().hits >= 1
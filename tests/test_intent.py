@@ -2,7 +2,9 @@
 # Licensed under MIT
 
 import asyncio
+import re
 import pytest
+from andromeda import intent
 from andromeda.intent import _intents, clear_intents, match_and_execute, register_intent
 
 
@@ -45,8 +47,27 @@ class TestRegisterIntent:
         register_intent(patterns=[r"\baddio\b"], tool_handler=lambda args: "bye")
         assert len(_intents) == 2
 
+    def test_register_precompiled_pattern(self):
+        pattern = re.compile(r"\bciao\b", re.IGNORECASE)
+        register_intent(patterns=(pattern,), tool_handler=lambda args: "hi")
+        assert _intents[0]["patterns"][0] is pattern
+
 
 class TestMatchAndExecute:
+    @pytest.mark.asyncio
+    async def test_precompiled_verbose_pattern_keeps_flags(self):
+        register_intent(patterns=[re.compile(r"ci ao  # greeting", re.VERBOSE)], tool_handler=lambda args: "hello!")
+        assert intent._combined is not None
+        assert await match_and_execute("ciao a tutti") == "hello!"
+
+    @pytest.mark.asyncio
+    async def test_precompiled_dotall_pattern_keeps_flags(self):
+        register_intent(patterns=[re.compile(r"alza.volume", re.DOTALL)], tool_handler=lambda args: "up")
+        register_intent(patterns=[r"\bvolume\b"], tool_handler=lambda args: "other")
+        assert intent._combined is not None
+        assert await match_and_execute("alza\nvolume") == "up"
+        assert await match_and_execute("alza il volume") == "other"
+
     @pytest.mark.asyncio
     async def test_match_simple_pattern(self):
         register_intent(patterns=[r"\bciao\b"], tool_handler=lambda args: "hello!")
@@ -72,6 +93,20 @@ class TestMatchAndExecute:
         result = await match_and_execute("test")
         assert result == "first"
 
+    @pytest.mark.asyncio
+    async def test_first_intent_wins_regardless_of_position(self):
+        register_intent(patterns=[r"\bora\b"], tool_handler=lambda args: "time")
+        register_intent(patterns=[r"\balza\b"], tool_handler=lambda args: "volume")
+        result = await match_and_execute("alza il volume, che ora è")
+        assert result == "time"
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_patterns_cannot_be_combined(self):
+        register_intent(patterns=[r"(?P<word>ciao)"], tool_handler=lambda args: "first")
+        register_intent(patterns=[r"(?P<word>addio)"], tool_handler=lambda args: "second")
+        assert intent._combined is None
+        assert await match_and_execute("addio") == "second"
+
     @pytest.mark.asyncio
     async def test_multiple_patterns_any_matches(self):
         register_intent(
@@ -23,6 +23,14 @@ class TestMessages:
         assert messages.get_locale() == "en"
         assert "could not hear anything" in messages.msg("core.no_speech_retry")
 
+    def test_missing_english_key_falls_back_to_italian(self, monkeypatch):
+        monkeypatch.setitem(messages._MESSAGES["it"], "test.only_it", "Solo italiano {x}")
+        messages.set_locale("en")
+        assert messages.msg("test.only_it", x=1) == "Solo italiano 1"
+
+    def test_unknown_key_returns_key(self):
+        assert messages.msg("test.does_not_exist") == "test.does_not_exist"
+
     def test_datetime_localization(self):
         now = datetime(2026, 2, 24, 13, 45)
         messages.set_locale("en")
@@ -34,3 +42,10 @@ class TestMessages:
         date_text_it, time_text_it = messages.get_localized_datetime(now)
         assert "febbraio" in date_text_it
         assert time_text_it == "13:45"
+
+    def test_weather_condition_follows_locale(self):
+        messages.set_locale("en")
+        english = messages.weather_condition(0)
+        messages.set_locale("it")
+        assert messages.weather_condition(0) != english
+        assert messages.weather_condition(-1) == messages.msg("weather.unknown_condition")
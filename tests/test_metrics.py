@@ -14,6 +14,10 @@ class TestPhaseMetric:
         assert m.min_ms == float("inf")
         assert m.max_ms == 0.0
 
+    def test_uses_slots(self):
+        m = PhaseMetric(name="test")
+        assert not hasattr(m, "__dict__")
+
     def test_avg_zero_count(self):
         m = PhaseMetric(name="test")
         assert m.avg_ms == 0.0
@@ -82,6 +86,15 @@ class TestPerformanceMetrics:
         assert summary["pipeline_total"]["count"] == 1
         assert summary["pipeline_total"]["avg_ms"] > 0
 
+    def test_record_direct(self):
+        metrics = PerformanceMetrics()
+        metrics.record("stt", 10.0)
+        metrics.record("stt", 30.0)
+
+        summary = metrics.get_summary()
+        assert summary["stt"]["count"] == 2
+        assert summary["stt"]["avg_ms"] == pytest.approx(20.0)
+
     def test_end_pipeline_without_start(self):
         metrics = PerformanceMetrics()
         metrics.end_pipeline()  # Should not crash
@@ -91,6 +104,17 @@ class TestPerformanceMetrics:
         metrics = PerformanceMetrics()
         assert metrics.get_summary() == {}
 
+    def test_get_summary_cached_until_record(self):
+        metrics = PerformanceMetrics()
+        metrics.record("stt", 10.0)
+        first = metrics.get_summary()
+        assert metrics.get_summary() is first
+
+        metrics.record("stt", 20.0)
+        second = metrics.get_summary()
+        assert second is not first
+        assert second["stt"]["count"] == 2
+
     def test_log_summary_empty(self):
         metrics = PerformanceMetrics()
         metrics.log_summary()  # Should not crash
@@ -1,11 +1,13 @@
 # Copyright (c) 2026 Alessandro Orrù
 # Licensed under MIT
 
+import asyncio
+import contextlib
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 import numpy as np
 import pytest
-from andromeda.main import VoiceAssistant
+from andromeda.main import VoiceAssistant, _cancel_tasks
 from andromeda.messages import msg
 from andromeda.metrics import PerformanceMetrics
 from andromeda.state_machine import AssistantState
@@ -13,11 +15,14 @@ from andromeda.state_machine import AssistantState
 
 def _build_assistant_for_processing(streaming: bool = False) -> VoiceAssistant:
     assistant = VoiceAssistant.__new__(VoiceAssistant)
-    assistant._cfg = SimpleNamespace(agent=SimpleNamespace(streaming=streaming))
+    assistant._cfg = SimpleNamespace(agent=SimpleNamespace(streaming=streaming, prefill=True))
     assistant._metrics = PerformanceMetrics()
     assistant._recorded_audio = np.array([0.1, 0.2], dtype=np.float32)
     assistant._stt = SimpleNamespace(transcribe=AsyncMock(return_value="test input"))
-    assistant._audio = SimpleNamespace(mute=MagicMock(), unmute=MagicMock())
+    assistant._agent = SimpleNamespace(prefill=AsyncMock())
+    assistant._prefill_task = None
+    assistant._models_task = None
+    assistant._audio = SimpleNamespace(muted=MagicMock(side_effect=contextlib.nullcontext))
     assistant._tts = SimpleNamespace(speak=AsyncMock())
     assistant._feedback = SimpleNamespace(play=MagicMock(), stop=MagicMock())
     assistant._response_text = ""
@@ -41,8 +46,9 @@ class TestPipelineIntegration:
         assert next_state == AssistantState.SPEAKING
         assert assistant._response_text == "Sono le dieci"
         assert assistant._tts.speak.await_count == 1
-        assert assistant._audio.mute.call_count == 1
-        assert assistant._audio.unmute.call_count == 1
+        assistant._audio.muted.assert_called_once()
+        await assistant._prefill_task
+        assistant._agent.prefill.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_processing_llm_failure_fallback(self):
@@ -55,3 +61,111 @@ class TestPipelineIntegration:
         assert next_state == AssistantState.SPEAKING
         assistant._speak_error.assert_awaited_once_with(msg("core.generic_error_retry"))
         assert assistant._response_text == msg("core.generic_error_retry")
+
+    @pytest.mark.asyncio
+    async def test_processing_waits_for_background_models(self):
+        assistant = _build_assistant_for_processing(streaming=False)
+        loaded = asyncio.Event()
+
+        async def load_models():
+            await asyncio.sleep(0.01)
+            loaded.set()
+
+        assistant._models_task = asyncio.create_task(load_models())
+        assistant._stt.transcribe = AsyncMock(side_effect=lambda _audio: "che ora è" if loaded.is_set() else "")
+
+        with patch("andromeda.main.match_and_execute", AsyncMock(return_value="Sono le dieci")):
+            next_state = await VoiceAssistant._handle_processing(assistant, AssistantState.PROCESSING)
+
+        assert next_state == AssistantState.SPEAKING
+        assert assistant._response_text == "Sono le dieci"
+        await assistant._prefill_task
+
+    @pytest.mark.asyncio
+    async def test_failed_model_load_cancels_run(self):
+        async def failing_load():
+            raise RuntimeError("no model")
+
+        run_task = asyncio.create_task(asyncio.sleep(10))
+        models_task = asyncio.create_task(failing_load())
+        with pytest.raises(RuntimeError):
+            await models_task
+
+        VoiceAssistant._on_models_loaded(models_task, run_task)
+        with pytest.raises(asyncio.CancelledError):
+            await run_task
+
+
+    @pytest.mark.asyncio
+    async def test_failed_model_load_propagates_from_run(self):
+        assistant = VoiceAssistant.__new__(VoiceAssistant)
+        assistant._initialize_models = MagicMock(side_effect=RuntimeError("no model"))
+
+        async def pipeline():
+            await asyncio.sleep(10)
+
+        assistant._run_pipeline = pipeline
+
+        with pytest.raises(RuntimeError, match="no model"):
+            await asyncio.wait_for(assistant.run(), 5.0)
+
+
+    @pytest.mark.asyncio
+    async def test_prefill_disabled_skips_startup_and_keepalive(self):
+        assistant = VoiceAssistant.__new__(VoiceAssistant)
+        assistant._cfg = SimpleNamespace(agent=SimpleNamespace(prewarm=True, prefill=False, prefix_refresh_sec=0.01))
+        assistant._agent = SimpleNamespace(prewarm_model=AsyncMock(), prefill=AsyncMock())
+        assistant._health = SimpleNamespace(start=AsyncMock(), stop=AsyncMock())
+        assistant._audio = SimpleNamespace(start=MagicMock(), stop=MagicMock())
+        assistant._feedback = SimpleNamespace(play=MagicMock())
+        assistant._wake_word = SimpleNamespace(shutdown=MagicMock())
+        assistant._metrics = SimpleNamespace(log_summary=MagicMock())
+        assistant._keepalive_task = None
+
+        async def idle_run():
+            await asyncio.sleep(0.05)
+
+        assistant._sm = SimpleNamespace(state=AssistantState.IDLE, run=idle_run)
+
+        await VoiceAssistant._run_pipeline(assistant)
+
+        assistant._agent.prewarm_model.assert_awaited_once()
+        assistant._agent.prefill.assert_not_awaited()
+        assert assistant._keepalive_task is None
+
+
+class TestAudioFrameDispatch:
+    def _build(self, vad_active: bool) -> VoiceAssistant:
+        assistant = VoiceAssistant.__new__(VoiceAssistant)
+        assistant._wake_word = SimpleNamespace(process_frame=MagicMock())
+        assistant._vad = SimpleNamespace(is_active=vad_active, process_frame=MagicMock())
+        return assistant
+
+    def test_idle_frame_goes_to_wake_word_only(self):
+        assistant = self._build(vad_active=False)
+        frame = np.zeros(480, dtype=np.int16)
+        assistant._process_audio_frame(frame.tobytes(), frame)
+        assistant._wake_word.process_frame.assert_called_once()
+        assistant._vad.process_frame.assert_not_called()
+
+    def test_listening_frame_goes_to_vad_only(self):
+        assistant = self._build(vad_active=True)
+        frame = np.zeros(480, dtype=np.int16)
+        assistant._process_audio_frame(frame.tobytes(), frame)
+        assistant._vad.process_frame.assert_called_once()
+        assistant._wake_word.process_frame.assert_not_called()
+
+
+class TestCancelTasks:
+    @pytest.mark.asyncio
+    async def test_cancels_and_joins_all(self):
+        tasks = [asyncio.create_task(asyncio.sleep(10)) for _ in range(3)]
+        await _cancel_tasks([*tasks, None])
+        assert all(t.cancelled() for t in tasks)
+
+    @pytest.mark.asyncio
+    async def test_ignores_finished_tasks(self):
+        done = asyncio.create_task(asyncio.sleep(0, result="ok"))
+        await done
+        await _cancel_tasks([done])
+        assert done.result() == "ok"
@@ -19,6 +19,10 @@ class TestAssistantState:
         assert str(AssistantState.LISTENING) == "LISTENING"
         assert str(AssistantState.SPEAKING) == "SPEAKING"
 
+    def test_format_uses_name(self):
+        assert f"{AssistantState.PROCESSING}" == "PROCESSING"
+        assert format(AssistantState.ERROR) == "ERROR"
+
 
 class TestTransitions:
     def test_idle_can_go_to_listening(self):
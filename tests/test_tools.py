@@ -3,14 +3,18 @@
 
 import asyncio
 import json
+import logging
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
+from andromeda import tools
 from andromeda.config import ToolsConfig
 from andromeda.intent import clear_intents, match_and_execute
-from andromeda.tools import get_datetime, knowledge_base, register_all_tools, set_timer, system_control
+from andromeda.messages import set_locale
+from andromeda.tools import get_datetime, get_latest_news, get_weather, knowledge_base, register_all_tools, set_timer, system_control
 
 
 class TestGetDatetime:
@@ -27,6 +31,22 @@ class TestGetDatetime:
         result = get_datetime.handler({})
         assert str(datetime.now().year) in result
 
+    def test_handler_cached_within_minute(self):
+        with patch.object(get_datetime, "get_localized_datetime", wraps=get_datetime.get_localized_datetime) as build:
+            get_datetime._last_key = None
+            first = get_datetime.handler({})
+            assert get_datetime.handler({}) == first
+        assert build.call_count <= 2  # A minute boundary between calls is the only miss
+
+    def test_handler_cache_follows_locale(self):
+        try:
+            set_locale("it")
+            italian = get_datetime.handler({})
+            set_locale("en")
+            assert get_datetime.handler({}) != italian
+        finally:
+            set_locale("it")
+
     def test_definition_structure(self):
         assert get_datetime.DEFINITION["type"] == "function"
         assert get_datetime.DEFINITION["function"]["name"] == "get_datetime"
@@ -60,6 +80,12 @@ class TestKnowledgeBase:
         result = knowledge_base.handler({"action": "recall", "key": "wifi"})
         assert "mywifi" in result
 
+    def test_recall_fuzzy_sees_keys_saved_later(self):
+        knowledge_base.handler({"action": "save", "key": "Compleanno_Mamma", "value": "3 maggio"})
+        assert "3 maggio" in knowledge_base.handler({"action": "recall", "key": "compleanno"})
+        knowledge_base.handler({"action": "save", "key": "Compleanno_Papà", "value": "9 luglio"})
+        assert "9 luglio" in knowledge_base.handler({"action": "recall", "key": "compleanno"})
+
     def test_list_empty(self):
         result = knowledge_base.handler({"action": "list"})
         assert "vuota" in result
@@ -111,6 +137,40 @@ class TestKnowledgeBase:
         store = json.loads(Path(temp_store).read_text())
         assert store["persist"] == "data123"
 
+    def test_reloads_after_external_edit(self, temp_store):
+        knowledge_base.handler({"action": "save", "key": "wifi", "value": "ABC123"})
+        path = Path(temp_store)
+        path.write_text(json.dumps({"wifi": "XYZ789"}))
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+        assert "XYZ789" in knowledge_base.handler({"action": "recall", "key": "wifi"})
+
+    def test_reloads_after_same_mtime_edit(self, temp_store):
+        knowledge_base.handler({"action": "save", "key": "wifi", "value": "ABC123"})
+        path = Path(temp_store)
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text(json.dumps({"wifi": "XYZ789-LONGER"}))
+        os.utime(path, ns=(mtime_ns, mtime_ns))  # Coarse filesystem: same mtime tick
+
+        assert "XYZ789-LONGER" in knowledge_base.handler({"action": "recall", "key": "wifi"})
+
+    def test_corrupt_file_is_never_written_over(self, temp_store):
+        path = Path(temp_store)
+        path.write_text('{"wifi": "ABC123",')
+
+        assert "non è valido" in knowledge_base.handler({"action": "save", "key": "k", "value": "v"})
+        assert "non è valido" in knowledge_base.handler({"action": "list"})
+        assert path.read_text() == '{"wifi": "ABC123",'
+
+        path.write_text('{"wifi": "ABC123"}')
+        assert "ABC123" in knowledge_base.handler({"action": "recall", "key": "wifi"})
+
+    def test_unchanged_file_is_not_reparsed(self):
+        knowledge_base.handler({"action": "save", "key": "wifi", "value": "ABC123"})
+        with patch.object(knowledge_base.json, "loads") as loads:
+            knowledge_base.handler({"action": "recall", "key": "wifi"})
+        loads.assert_not_called()
+
     def test_definition_structure(self):
         assert knowledge_base.DEFINITION["function"]["name"] == "knowledge_base"
         params = knowledge_base.DEFINITION["function"]["parameters"]
@@ -284,3 +344,137 @@ class TestToolRegistration:
         register_all_tools(agent, cfg, feedback)
 
         assert "system_control" in agent.registered
+
+
+class TestVolumeIntentPatterns:
+    @pytest.mark.parametrize("patterns, text", [
+        (tools._VOLUME_UP_PATTERNS, "alza un po' il volume"),
+        (tools._VOLUME_UP_PATTERNS, "volume più alto"),
+        (tools._VOLUME_DOWN_PATTERNS, "abbassa il volume"),
+        (tools._VOLUME_MUTE_PATTERNS, "muta il volume"),
+        (tools._VOLUME_MUTE_PATTERNS, "audio muto"),
+        (tools._VOLUME_MUTE_PATTERNS, "fai silenzio"),
+        (tools._VOLUME_MUTE_PATTERNS, "muta l'audio"),
+        (tools._VOLUME_MUTE_PATTERNS, "metti il volume in muto"),
+        (tools._VOLUME_MUTE_PATTERNS, "muta tutto il volume"),
+    ])
+    def test_matches(self, patterns, text):
+        assert any(p.search(text) for p in patterns)
+
+    def test_gap_is_bounded(self):
+        text = "alza " + "a" * 100 + " volume"
+        assert not any(p.search(text) for p in tools._VOLUME_UP_PATTERNS)
+
+
+class TestParseNewsArticles:
+    _HTML = """
+    <div><a href="https://www.ilpost.it/2026/01/02/primo-articolo"><h2>Primo titolo</h2></a>
+    <p>Un sommario abbastanza lungo per essere preso</p></div>
+    <div><a href="https://www.ilpost.it/2026/01/02/primo-articolo/"><h3>Duplicato</h3></a></div>
+    <div><a href="https://www.ilpost.it/mondo/"><h2>Sezione</h2></a></div>
+    <div><a href="https://www.ilpost.it/2026/01/03/secondo"><h2>Secondo titolo</h2></a></div>
+    """
+
+    def test_extracts_unique_articles(self):
+        articles = get_latest_news._parse_articles(self._HTML, 5)
+        assert [a["title"] for a in articles] == ["Primo titolo", "Secondo titolo"]
+        assert articles[0]["url"] == "https://www.ilpost.it/2026/01/02/primo-articolo/"
+        assert articles[0]["summary"] == "Un sommario abbastanza lungo per essere preso"
+
+    def test_respects_limit(self):
+        assert len(get_latest_news._parse_articles(self._HTML, 1)) == 1
+
+    def test_parse_cache_reuses_identical_html(self):
+        get_latest_news.configure(10.0)
+        with patch.object(get_latest_news, "_parse_articles", wraps=get_latest_news._parse_articles) as parse:
+            first = get_latest_news._parse_articles_cached(self._HTML, 5)
+            assert get_latest_news._parse_articles_cached(self._HTML, 5) is first
+            get_latest_news._parse_articles_cached(self._HTML, 1)
+        assert parse.call_count == 2
+
+    def test_parse_cache_is_bounded(self):
+        get_latest_news.configure(10.0)
+        for limit in range(1, get_latest_news._PARSED_CACHE_MAX_SIZE + 3):
+            get_latest_news._parse_articles_cached(self._HTML, limit)
+        assert len(get_latest_news._state.parsed) == get_latest_news._PARSED_CACHE_MAX_SIZE
+
+    @pytest.mark.parametrize("href, expected", [
+        ("https://www.ilpost.it/2026/01/02/titolo-articolo_2/", True),
+        ("https://www.ilpost.it/2026/01/02/è-così/", True),
+        ("https://www.ilpost.it/2026/1/02/titolo/", False),
+        ("https://www.ilpost.it/2026/01/02/", False),
+        ("https://www.ilpost.it/2026/01/02/a/b/", False),
+        ("https://www.ilpost.it/2026/01/02/titolo.html/", False),
+        ("https://www.ilpost.it/mondo/", False),
+    ])
+    def test_is_article_url(self, href, expected):
+        assert get_latest_news._is_article_url(href) is expected
+
+
+class TestNewsCache:
+    @pytest.fixture(autouse=True)
+    def reset_news(self):
+        get_latest_news.configure(10.0)
+        yield
+        get_latest_news.configure(10.0)
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        html = TestParseNewsArticles._HTML
+        with patch.object(get_latest_news, "_CACHE_MAX_SIZE", 2), \
+             patch.object(get_latest_news, "_fetch_page", AsyncMock(return_value=html)) as fetch:
+            await get_latest_news.handler({"category": "italia"})
+            await get_latest_news.handler({"category": "mondo"})
+            await get_latest_news.handler({"category": "italia"})  # Hit: italia becomes most recent
+            await get_latest_news.handler({"category": "sport"})   # Evicts mondo
+            assert fetch.await_count == 3
+            assert list(get_latest_news._state.cache) == ["italia:5", "sport:5"]
+
+    def test_warmup_parses_sample_document(self, caplog):
+        with caplog.at_level(logging.DEBUG, logger="[ TOOL GET LATEST NEWS ]"):
+            get_latest_news.warmup()
+        assert "HTML parser warm-up completed" in caplog.text
+
+    def test_warmup_thread_started_once(self):
+        tools._start_warmup.cache_clear()
+        try:
+            with patch.object(tools.threading, "Thread") as thread:
+                register_all_tools(DummyAgent(), ToolsConfig(), MagicMock())
+                register_all_tools(DummyAgent(), ToolsConfig(), MagicMock())
+            thread.assert_called_once()
+        finally:
+            clear_intents()
+
+
+class TestWeatherCache:
+    @pytest.fixture(autouse=True)
+    def reset_weather(self):
+        get_weather.configure(10.0)
+        yield
+        get_weather.configure(10.0)
+
+    @staticmethod
+    def _responses(*_args, **kwargs):
+        if "name" in kwargs["params"]:
+            return MagicMock(json=MagicMock(return_value={"results": [{"latitude": 1.0, "longitude": 2.0, "name": kwargs["params"]["name"]}]}))
+        return MagicMock(json=MagicMock(return_value={"current": {"temperature_2m": 20, "weather_code": 0}}))
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        with patch.object(get_weather, "_CACHE_MAX_SIZE", 2), \
+             patch.object(get_weather, "request_with_retry", AsyncMock(side_effect=self._responses)) as request:
+            await get_weather.handler({"city": "Roma"})
+            await get_weather.handler({"city": "Milano"})
+            await get_weather.handler({"city": "roma"})    # Hit: roma becomes most recent
+            await get_weather.handler({"city": "Napoli"})  # Evicts milano
+            assert request.await_count == 6
+            assert list(get_weather._state.cache) == ["roma", "napoli"]
+
+    @pytest.mark.asyncio
+    async def test_known_city_skips_geocoding(self):
+        with patch.object(get_weather, "_CACHE_TTL_SEC", 0.0), \
+             patch.object(get_weather, "request_with_retry", AsyncMock(side_effect=self._responses)) as request:
+            await get_weather.handler({"city": "Roma"})
+            result = await get_weather.handler({"city": "roma"})  # Result expired, coordinates still known
+            assert request.await_count == 3
+            assert "Roma" in result
@@ -3,7 +3,10 @@
 
 import numpy as np
 import pytest
-from andromeda.tts import _FADE_SAMPLES, _apply_fade_out
+from andromeda import tts
+from andromeda.config import AudioConfig, TTSConfig
+from andromeda.messages import msg
+from andromeda.tts import _FADE_SAMPLES, TextToSpeech, _apply_fade_out
 
 
 class TestApplyFadeOut:
@@ -56,3 +59,27 @@ class TestFadeConstants:
     def test_fade_samples_reasonable(self):
         # At 22050Hz, 64 samples = ~3ms of fade — reasonable
         assert _FADE_SAMPLES <= 256
+
+
+class TestCache:
+    def test_prewarm_covers_all_fixed_messages(self):
+        engine = TextToSpeech(AudioConfig(), TTSConfig())
+        engine._synthesize = lambda text: (np.zeros(10, dtype=np.float32), 22050)
+        engine.prewarm_cache()
+
+        for key in tts._PREWARM_MESSAGE_KEYS:
+            assert engine._cache_key(msg(key)) in engine._cache
+
+    def test_pinned_entries_survive_eviction(self, monkeypatch):
+        monkeypatch.setattr(tts, "_TTS_CACHE_MAX", 2)
+        engine = TextToSpeech(AudioConfig(), TTSConfig())
+        audio = np.zeros(10, dtype=np.float32)
+
+        engine._cache_put("pinned", audio, 22050, pinned=True)
+        for i in range(5):
+            engine._cache_put(f"dynamic {i}", audio, 22050)
+
+        assert "pinned" in engine._cache
+        assert "dynamic 0" not in engine._cache
+        assert "dynamic 4" in engine._cache
+        assert len(engine._cache) == 3
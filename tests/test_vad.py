@@ -38,6 +38,17 @@ class TestEnergyThreshold:
         vad.set_energy_threshold(0.0)
         assert vad._energy_threshold == 0
 
+    def test_frame_rms_matches_reference(self):
+        vad = VoiceActivityDetector(AudioConfig(), VADConfig())
+        frame = np.random.default_rng(0).integers(-32768, 32767, 480, dtype=np.int16)
+        expected = float(np.sqrt(np.mean(frame.astype(np.float64) ** 2)))
+        assert vad._frame_rms(frame) == pytest.approx(expected, rel=1e-4)
+
+    def test_frame_rms_handles_other_sizes(self):
+        vad = VoiceActivityDetector(AudioConfig(), VADConfig())
+        assert vad._frame_rms(np.full(160, 100, dtype=np.int16)) == pytest.approx(100.0)
+        assert vad._frame_rms(np.array([], dtype=np.int16)) == 0.0
+
 
 class TestVADStartStop:
     def test_start_resets_state(self):
@@ -58,6 +69,14 @@ class TestVADStartStop:
         vad.stop()
         assert not vad._is_active
 
+    def test_is_active_follows_start_stop(self):
+        vad = VoiceActivityDetector(AudioConfig(), VADConfig())
+        assert vad.is_active is False
+        vad.start()
+        assert vad.is_active is True
+        vad.stop()
+        assert vad.is_active is False
+
 
 class TestProcessFrame:
     def test_inactive_ignores_frame(self):
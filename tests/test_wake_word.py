@@ -0,0 +1,75 @@
+# Copyright (c) 2026 Alessandro Orrù
+# Licensed under MIT
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from andromeda.config import AudioConfig, WakeWordConfig
+from andromeda.wake_word import WakeWordDetector
+
+
+class TestWaitForDetectionAsync:
+    @pytest.mark.asyncio
+    async def test_timeout_returns_false(self):
+        detector = WakeWordDetector(AudioConfig(), WakeWordConfig())
+        assert await detector.wait_for_detection_async(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_detection_from_other_thread(self):
+        detector = WakeWordDetector(AudioConfig(), WakeWordConfig())
+        waiter = asyncio.create_task(detector.wait_for_detection_async(2.0))
+        await asyncio.sleep(0)  # Let the waiter bind to the loop
+
+        threading.Thread(target=detector._signal_detected).start()
+        assert await waiter is True
+        assert not detector._detected.is_set()
+
+    @pytest.mark.asyncio
+    async def test_detection_before_wait_is_not_lost(self):
+        detector = WakeWordDetector(AudioConfig(), WakeWordConfig())
+        detector._signal_detected()
+        assert await detector.wait_for_detection_async(0.01) is True
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_pending_detection(self):
+        detector = WakeWordDetector(AudioConfig(), WakeWordConfig())
+        await detector.wait_for_detection_async(0.01)
+        detector._signal_detected()
+        detector.reset()
+        assert await detector.wait_for_detection_async(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_shutdown_unblocks_waiter(self):
+        detector = WakeWordDetector(AudioConfig(), WakeWordConfig())
+        waiter = asyncio.create_task(detector.wait_for_detection_async())
+        await asyncio.sleep(0)
+
+        detector.shutdown()
+        assert await asyncio.wait_for(waiter, 1.0) is False
+
+
+class TestProcessFrame:
+    def _detector(self, prediction: dict) -> WakeWordDetector:
+        detector = WakeWordDetector(AudioConfig(), WakeWordConfig(threshold=0.5))
+        detector._model = MagicMock(predict=MagicMock(return_value=prediction))
+        return detector
+
+    def test_best_score_above_threshold_detects(self):
+        detector = self._detector({"a": 0.1, "b": 0.9})
+        detector.process_frame(b"", np.zeros(480, dtype=np.int16))
+        assert detector._detected.is_set()
+        detector._model.reset.assert_called_once()
+
+    def test_all_below_threshold_does_not_detect(self):
+        detector = self._detector({"a": 0.1, "b": 0.4})
+        detector.process_frame(b"", np.zeros(480, dtype=np.int16))
+        assert not detector._detected.is_set()
+
+    def test_empty_prediction_is_ignored(self):
+        detector = self._detector({})
+        detector.process_frame(b"", np.zeros(480, dtype=np.int16))
+        assert not detector._detected.is_set()